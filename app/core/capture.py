@@ -7,6 +7,7 @@ See TDD Section 5 and Executable Spec Section 2.2 for requirements.
 import gc
 import json
 import os as _os
+import threading
 import time
 from dataclasses import dataclass
 from typing import Optional
@@ -30,9 +31,9 @@ def _log_debug(location: str, message: str, data: dict, hypothesis_id: str):
 from .constants import (
     CAPTURE_RETRY_INTERVAL_MS,
     CAPTURE_RETRY_N,
-    GRAY_WEIGHT_B,
-    GRAY_WEIGHT_G,
-    GRAY_WEIGHT_R,
+    GRAY_WEIGHT_B_Q8,
+    GRAY_WEIGHT_G_Q8,
+    GRAY_WEIGHT_R_Q8,
 )
 from .model import ROI, Rect, VirtualDesktopInfo
 
@@ -176,11 +177,29 @@ def crop_roi(
     return full_image[y0:y1, x0:x1].copy()
 
 
+# Per-thread pair of uint16 buffers for to_grayscale, reallocated only
+# when the frame shape changes
+_gray_scratch = threading.local()
+
+
+def _gray_scratch_pair(shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """Get this thread's uint16 grayscale scratch buffers for a shape."""
+    bufs = getattr(_gray_scratch, "bufs", None)
+    if bufs is None or bufs[0].shape != shape:
+        bufs = (np.empty(shape, dtype=np.uint16), np.empty(shape, dtype=np.uint16))
+        _gray_scratch.bufs = bufs
+    return bufs
+
+
 def to_grayscale(image: np.ndarray) -> np.ndarray:
     """Convert BGRA/BGR image to grayscale.
 
-    Uses ITU-R BT.601 weights: Y = 0.299*R + 0.587*G + 0.114*B
-    Optimized to minimize temporary array allocations.
+    Uses ITU-R BT.601 weights: Y = 0.299*R + 0.587*G + 0.114*B, evaluated
+    in 8-bit fixed point as (77*R + 150*G + 29*B + 128) >> 8 so the whole
+    computation stays in uint16 (max 255*256 + 128 fits) instead of float64.
+    Result is the float formula rounded to nearest, within ±1 of it. The
+    uint16 intermediates live in per-thread scratch; only the returned
+    uint8 frame is allocated per call.
 
     Args:
         image: Input image in BGR or BGRA format (from mss)
@@ -188,21 +207,21 @@ def to_grayscale(image: np.ndarray) -> np.ndarray:
     Returns:
         Grayscale image as uint8 numpy array
     """
-    # mss returns BGRA format
-    # Extract B, G, R channels (ignore alpha if present)
     if image.ndim == 2:
         # Already grayscale
         return image.astype(np.uint8)
 
-    # Optimized: use in-place operations and avoid multiple large temporary arrays
-    # Use numpy's einsum or direct computation with minimal allocations
-    gray = (
-        GRAY_WEIGHT_B * image[:, :, 0]
-        + GRAY_WEIGHT_G * image[:, :, 1]
-        + GRAY_WEIGHT_R * image[:, :, 2]
-    ).astype(np.uint8)
-
-    return gray
+    # mss returns BGRA format; alpha (if present) is ignored
+    gray, tmp = _gray_scratch_pair(image.shape[:2])
+    np.multiply(image[:, :, 0], GRAY_WEIGHT_B_Q8, out=gray, dtype=np.uint16)
+    np.multiply(image[:, :, 1], GRAY_WEIGHT_G_Q8, out=tmp, dtype=np.uint16)
+    gray += tmp
+    np.multiply(image[:, :, 2], GRAY_WEIGHT_R_Q8, out=tmp, dtype=np.uint16)
+    gray += tmp
+    gray += 128
+    gray >>= 8
+
+    return gray.astype(np.uint8)
 
 
 # Module-level reusable mss instance to avoid repeated creation/destruction
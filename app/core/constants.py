@@ -38,6 +38,12 @@ CALIB_FRAMES_DEFAULT: Final[int] = 8
 CALIB_INTERVAL_MS: Final[int] = 150
 """校准采样间隔毫秒 (100-200ms recommended)"""
 
+DIFF_FAST_MIN_PIXELS: Final[int] = 65536
+"""fast精度下超过该像素数 (256x256) 的帧按2x2抽样计算diff"""
+
+DIFF_TINY_MAX_PIXELS: Final[int] = 48
+"""少于该像素数的矩形帧直接用Python整数求和计算diff"""
+
 # Error handling
 CAPTURE_RETRY_N: Final[int] = 3
 """截图失败重试次数"""
@@ -60,4 +66,8 @@ GRAY_WEIGHT_R: Final[float] = 0.299
 GRAY_WEIGHT_G: Final[float] = 0.587
 GRAY_WEIGHT_B: Final[float] = 0.114
 
-
+# Same weights in 8-bit fixed point (77, 150, 29: sum to 256, so
+# Y = (sum + 128) >> 8)
+GRAY_WEIGHT_R_Q8: Final[int] = round(GRAY_WEIGHT_R * 256)
+GRAY_WEIGHT_G_Q8: Final[int] = round(GRAY_WEIGHT_G * 256)
+GRAY_WEIGHT_B_Q8: Final[int] = round(GRAY_WEIGHT_B * 256)
@@ -4,8 +4,14 @@ Implements the change detection algorithm and noise-based threshold
 calibration as specified in Executable Spec Sections 7 and 8.
 """
 
+import math
+import operator
+import threading
 import time
-from typing import Optional
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal, Optional, Union
 
 import numpy as np
 
@@ -13,16 +19,26 @@ from .capture import capture_roi_gray, to_grayscale
 from .constants import (
     CALIB_FRAMES_DEFAULT,
     CALIB_INTERVAL_MS,
+    DIFF_FAST_MIN_PIXELS,
+    DIFF_TINY_MAX_PIXELS,
     TH_HOLD_MAX,
     TH_HOLD_MIN,
 )
+from .logging import get_logger
 from .model import ROI, CalibrationStats, Circle, ROIShape
 
-# Get logger for debug info
+# Reused scratch for calibration diffs; k_frames is capped at 10, and
+# calibration never runs concurrently
+_DI_BUF = np.empty(10, dtype=np.float64)
+
+# Per-thread int16 scratch for absdiff, reallocated only when the ROI
+# shape changes (the worker and calibration may run on different threads)
+_scratch = threading.local()
+
+
 def _get_diff_logger():
-    """Get logger instance, lazy init to avoid circular imports."""
+    """Get the current logger instance, or None if unavailable."""
     try:
-        from .logging import get_logger
         return get_logger()
     except:
         return None
@@ -40,33 +56,136 @@ def create_circle_mask(height: int, width: int, circle: Circle) -> np.ndarray:
         circle: Circle parameters (in local ROI coordinates)
 
     Returns:
-        Boolean mask array of shape (height, width)
+        Boolean mask array of shape (height, width). The circle is the
+        one inscribed in the frame, so the mask depends only on the frame
+        size; masks are cached per size and shared, hence read-only.
+    """
+    return _circle_mask(height, width)[0]
+
+
+# Masks are 1 byte per pixel (8 MB for a 4K ROI); a run uses one ROI
+# size at a time, so a few entries cover re-selection without letting
+# stale full-screen masks pile up
+@lru_cache(maxsize=4)
+def _circle_mask(height: int, width: int) -> tuple[np.ndarray, int]:
+    """Build the read-only inscribed-circle mask for a frame size.
+
+    Works in doubled integer coordinates so the test is exact in int32:
+    with center (w/2, h/2) and r = min(w, h)/2, the condition
+    (x - cx)^2 + (y - cy)^2 <= r^2 is (2x - w)^2 + (2y - h)^2 <= min(w, h)^2.
+    The circle is symmetric about y = h/2, so row y equals row h - y and
+    only rows 0..h//2 are computed; the rest are mirrored copies.
+
+    Returns:
+        Tuple of (mask, number of True pixels), cached together so diff
+        calls never rescan the mask for its pixel count
     """
-    # Create coordinate grids
     # Note: In array coordinates, rows are y and columns are x
-    y_coords, x_coords = np.ogrid[:height, :width]
+    # Since the ROI rect starts at (rect.x, rect.y), the local center is
+    # (w/2, h/2) regardless of the circle's desktop coordinates
+    dx2 = np.arange(width, dtype=np.int32)
+    dx2 *= 2
+    dx2 -= width
+    np.multiply(dx2, dx2, out=dx2)
+
+    half = min(height // 2 + 1, height)
+    dy2 = np.arange(half, dtype=np.int32)
+    dy2 *= 2
+    dy2 -= height
+    np.multiply(dy2, dy2, out=dy2)
+
+    diameter = min(width, height)
+    mask = np.empty((height, width), dtype=bool)
+    np.less_equal(dy2[:, None] + dx2[None, :], diameter * diameter, out=mask[:half])
+    if height > half:
+        # Rows half..h-1 mirror rows h-half..1
+        mask[half:] = mask[height - half:0:-1]
+    mask.flags.writeable = False
+    return mask, int(np.count_nonzero(mask))
+
+
+def _absdiff_scratch(shape: tuple[int, ...]) -> np.ndarray:
+    """Get this thread's int16 absdiff scratch array for the given shape.
+
+    Args:
+        shape: Frame shape
+
+    Returns:
+        int16 array of that shape, reused across calls
+    """
+    buf = getattr(_scratch, "buf", None)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape, dtype=np.int16)
+        _scratch.buf = buf
+    return buf
+
+
+def _absdiff_u8(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Per-pixel absolute difference of two uint8 frames.
+
+    Subtracts straight into an int16 buffer (which holds [-255, 255]
+    exactly) and takes abs in place, so there is one scratch array and
+    no float temporaries. For uint8 inputs the result lives in this
+    thread's scratch buffer and is only valid until the next call on
+    the same thread.
+
+    Args:
+        a: First grayscale uint8 frame
+        b: Second grayscale uint8 frame of the same shape
+
+    Returns:
+        Non-negative integer array of |a - b|
+    """
+    if a.dtype != np.uint8 or b.dtype != np.uint8:
+        absdiff = np.maximum(a, b)
+        absdiff -= np.minimum(a, b)
+        return absdiff
+
+    buf = _absdiff_scratch(a.shape)
+    np.subtract(a, b, out=buf, dtype=np.int16)
+    np.abs(buf, out=buf)
+    return buf
 
-    # Calculate local circle center (relative to ROI top-left)
-    # The circle.cx and circle.cy are in virtual desktop coordinates
-    # For the mask, we need local coordinates within the ROI
-    # Since the ROI rect starts at (rect.x, rect.y), the local center is:
-    # cx_local = circle.cx - rect.x = (rect.x + w/2) - rect.x = w/2
-    # cy_local = circle.cy - rect.y = (rect.y + h/2) - rect.y = h/2
-    cx_local = width / 2
-    cy_local = height / 2
-    r = min(width, height) / 2
 
-    # Calculate squared distance from center
-    dist_sq = (x_coords - cx_local) ** 2 + (y_coords - cy_local) ** 2
+def _sad_u8(absdiff: np.ndarray) -> float:
+    """Mean of an absolute-difference array, normalized to [0, 1].
 
-    # Create mask: True where inside circle
-    return dist_sq <= r ** 2
+    Sums in integer arithmetic, which is exact and cheaper than a
+    float mean.
+    """
+    return int(absdiff.sum(dtype=np.int64)) / absdiff.size / 255.0
+
+
+def _sad_u8_small(a: np.ndarray, b: np.ndarray) -> float:
+    """Normalized mean absolute difference of two tiny uint8 frames.
+
+    For a few dozen pixels NumPy's per-call overhead dominates, so the
+    pixels are summed as Python ints instead. Gives exactly the same
+    value as _sad_u8(_absdiff_u8(a, b)).
+    """
+    total = sum(map(abs, map(operator.sub, a.ravel().tolist(), b.ravel().tolist())))
+    return total / a.size / 255.0
+
+
+def _same_buffer(a: np.ndarray, b: np.ndarray) -> bool:
+    """Check whether two arrays view exactly the same memory.
+
+    Compares data pointer, strides and dtype (shapes are checked by the
+    caller); this is O(1) and never touches the pixels.
+    """
+    return (
+        a.ctypes.data == b.ctypes.data
+        and a.strides == b.strides
+        and a.dtype == b.dtype
+    )
 
 
 def calculate_diff(
     frame_t: np.ndarray,
     frame_t0: np.ndarray,
     roi: Optional[ROI] = None,
+    mask: Optional[np.ndarray] = None,
+    precision: Literal["full", "fast"] = "full",
 ) -> float:
     """Calculate the difference between two frames.
 
@@ -80,6 +199,11 @@ def calculate_diff(
         frame_t: Current frame (grayscale uint8)
         frame_t0: Reference frame (grayscale uint8)
         roi: Optional ROI for circle mask (if shape is CIRCLE)
+        mask: Optional precomputed circle mask for the frame shape,
+            built from roi when not given
+        precision: "full" diffs every pixel. "fast" diffs every other
+            row and column of frames larger than DIFF_FAST_MIN_PIXELS,
+            a quarter of the work for a mean that stays within ~1%
 
     Returns:
         Diff value in range [0.0, 1.0]
@@ -87,58 +211,190 @@ def calculate_diff(
     Raises:
         ValueError: If frames have different shapes
     """
-    logger = _get_diff_logger()
-    
+    # The logger is looked up only on the paths that log, keeping the
+    # common rect-ROI call free of that work
     if frame_t.shape != frame_t0.shape:
-        error_msg = f"Frame shapes must match: {frame_t.shape} vs {frame_t0.shape}"
+        error_msg = "Frame shapes must match: " + repr(frame_t.shape) + " vs " + repr(frame_t0.shape)
+        logger = _get_diff_logger()
         if logger:
             logger.error(error_msg, frame_t_shape=str(frame_t.shape), frame_t0_shape=str(frame_t0.shape))
         raise ValueError(error_msg)
 
+    # Same object, or two views over the same pixels: nothing changed
+    if frame_t is frame_t0 or _same_buffer(frame_t, frame_t0):
+        return 0.0
+
+    # Fast mode: 2x2 decimation of large frames (and the mask with them)
+    if precision == "fast" and frame_t.shape[0] * frame_t.shape[1] > DIFF_FAST_MIN_PIXELS:
+        frame_t = frame_t[::2, ::2]
+        frame_t0 = frame_t0[::2, ::2]
+        if mask is not None:
+            mask = mask[::2, ::2]
+
+    # Resolve the circle mask and its pixel count before touching pixels
+    # (Spec 4.2, 7.1); an empty mask needs no diff at all
+    is_circle = roi is not None and roi.shape == ROIShape.CIRCLE
+    if is_circle:
+        height, width = frame_t.shape[:2]
+        if mask is None:
+            mask, masked_count = _circle_mask(height, width)
+        else:
+            masked_count = int(np.count_nonzero(mask))
+        if masked_count == 0:
+            logger = _get_diff_logger()
+            if logger:
+                logger.warning("圆形蒙版内没有像素", height=height, width=width)
+            return 0.0
+
     # Ensure grayscale (2D array)
     if frame_t.ndim == 3:
         frame_t = to_grayscale(frame_t)
     if frame_t0.ndim == 3:
         frame_t0 = to_grayscale(frame_t0)
 
+    # Tiny rect frames: cheaper in plain Python than through NumPy
+    if (
+        not is_circle
+        and frame_t.size < DIFF_TINY_MAX_PIXELS
+        and frame_t.dtype == np.uint8
+        and frame_t0.dtype == np.uint8
+    ):
+        return _sad_u8_small(frame_t, frame_t0)
+
     # Calculate absolute difference
-    # Use int16 to avoid overflow issues with subtraction
     try:
-        absdiff = np.abs(
-            frame_t.astype(np.int16) - frame_t0.astype(np.int16)
-        ).astype(np.uint8)
+        absdiff = _absdiff_u8(frame_t, frame_t0)
     except Exception as e:
+        logger = _get_diff_logger()
         if logger:
             logger.exception("计算absdiff失败", e, frame_t_dtype=str(frame_t.dtype), frame_t0_dtype=str(frame_t0.dtype))
         raise
 
-    # Apply circle mask if needed (Spec 4.2, 7.1)
-    if roi is not None and roi.shape == ROIShape.CIRCLE:
-        height, width = absdiff.shape
-        mask = create_circle_mask(height, width, roi.circle)  # type: ignore
-        # Only count pixels inside the circle
-        masked_pixels = absdiff[mask]
-        if len(masked_pixels) == 0:
-            if logger:
-                logger.warning("圆形蒙版内没有像素", height=height, width=width)
-            return 0.0
-        mean_diff = float(np.mean(masked_pixels))
+    # Apply circle mask if needed
+    if is_circle:
+        logger = _get_diff_logger()
+        # Only count pixels inside the circle; summing in place with
+        # where= avoids gathering the masked pixels into a copy
+        mean_diff = int(absdiff.sum(where=mask, dtype=np.int64)) / masked_count
         if logger:
-            logger.debug(f"使用圆形蒙版", masked_pixel_count=len(masked_pixels), mean_diff=f"{mean_diff:.2f}")
-    else:
-        mean_diff = float(np.mean(absdiff))
+            logger.debug(f"使用圆形蒙版", masked_pixel_count=masked_count, mean_diff=f"{mean_diff:.2f}")
+        # Normalize to [0, 1]
+        return mean_diff / 255.0
 
-    # Normalize to [0, 1]
-    d = mean_diff / 255.0
+    # Whole ROI: integer sum, already normalized to [0, 1]
+    return _sad_u8(absdiff)
 
-    return d
+
+def make_diff_kernel(
+    roi: Optional[ROI],
+    shape: tuple[int, ...],
+) -> Callable[[np.ndarray, np.ndarray], float]:
+    """Build a diff function specialized for one ROI and frame shape.
+
+    Resolves everything calculate_diff decides per call up front: the
+    ROI shape branch, and for circles the mask and its pixel count. The
+    returned function computes the same value as calculate_diff(a, b, roi)
+    for grayscale frames of the given shape.
+
+    Args:
+        roi: ROI the frames were captured from (None behaves as rect)
+        shape: Grayscale frame shape (height, width)
+
+    Returns:
+        Function (frame_t, frame_t0) -> diff in [0.0, 1.0]. It raises
+        ValueError if the frames do not have the given shape.
+    """
+
+    def check_shape(frame_t: np.ndarray, frame_t0: np.ndarray) -> None:
+        if frame_t.shape != shape or frame_t0.shape != shape:
+            raise ValueError(
+                "Frame shapes must match: " + repr(frame_t.shape) + " vs " + repr(frame_t0.shape)
+            )
+
+    if roi is None or roi.shape != ROIShape.CIRCLE:
+        def rect_kernel(frame_t: np.ndarray, frame_t0: np.ndarray) -> float:
+            check_shape(frame_t, frame_t0)
+            return _sad_u8(_absdiff_u8(frame_t, frame_t0))
+
+        return rect_kernel
+
+    height, width = shape
+    mask, masked_count = _circle_mask(height, width)
+
+    def circle_kernel(frame_t: np.ndarray, frame_t0: np.ndarray) -> float:
+        check_shape(frame_t, frame_t0)
+        if masked_count == 0:
+            return 0.0
+        absdiff = _absdiff_u8(frame_t, frame_t0)
+        return int(absdiff.sum(where=mask, dtype=np.int64)) / masked_count / 255.0
+
+    return circle_kernel
+
+
+def calculate_diff_batch(
+    frames_t: Union[np.ndarray, Sequence[np.ndarray]],
+    frame_t0: np.ndarray,
+    roi: Optional[ROI] = None,
+) -> np.ndarray:
+    """Calculate the diff of several frames against one reference.
+
+    The ROI branch, circle mask and pixel count are resolved once via
+    make_diff_kernel, and every frame reuses the same absdiff scratch.
+
+    Args:
+        frames_t: Grayscale uint8 frames, as an (N, H, W) array or a
+            sequence of (H, W) arrays
+        frame_t0: Reference frame (grayscale uint8, (H, W))
+        roi: Optional ROI for circle mask (if shape is CIRCLE)
+
+    Returns:
+        float64 array of N diff values, each equal to
+        calculate_diff(frames_t[i], frame_t0, roi)
+
+    Raises:
+        ValueError: If any frame's shape differs from frame_t0's
+    """
+    kernel = make_diff_kernel(roi, frame_t0.shape)
+    out = np.empty(len(frames_t), dtype=np.float64)
+    for i, frame_t in enumerate(frames_t):
+        out[i] = kernel(frame_t, frame_t0)
+    return out
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
-    """Clamp a value to the given range."""
+    """Clamp a value to the given range.
+
+    Uses the C-level min/max builtins rather than Python branches.
+    The nesting order matters: a NaN value clamps to max_val.
+    """
     return max(min_val, min(max_val, value))
 
 
+def _mu_sigma_th(di: Sequence[float], lo: float, hi: float) -> tuple[float, float, float]:
+    """Compute calibration statistics from the per-frame diffs.
+
+    K is at most 10, so plain Python arithmetic beats the dispatch
+    overhead of np.mean/np.std on such short inputs.
+
+    Args:
+        di: Diff values of the calibration frames against the reference
+        lo: Lower bound for the recommended threshold
+        hi: Upper bound for the recommended threshold
+
+    Returns:
+        Tuple of (mu, sigma, th_rec), where sigma is the population
+        standard deviation and th_rec = clamp(mu + 3*sigma, lo, hi)
+    """
+    n = len(di)
+    if n == 0:
+        # Edge case: only one frame captured
+        return 0.0, 0.0, lo
+
+    mu = math.fsum(di) / n
+    sigma = math.sqrt(math.fsum((d - mu) * (d - mu) for d in di) / n)
+    return mu, sigma, clamp(mu + 3 * sigma, lo, hi)
+
+
 def calibrate_threshold(
     roi: ROI,
     k_frames: int = CALIB_FRAMES_DEFAULT,
@@ -166,43 +422,29 @@ def calibrate_threshold(
     # Validate k_frames
     k_frames = max(5, min(10, k_frames))
 
-    # Capture frames
-    frames: list[np.ndarray] = []
-    for i in range(k_frames):
-        frame = capture_roi_gray(roi)
-        frames.append(frame)
-        if i < k_frames - 1:
-            time.sleep(interval_ms / 1000.0)
-
-    # Use first frame as reference
-    ref = frames[0]
-
-    # Calculate diff for each subsequent frame
-    di_values: list[float] = []
-    for i in range(1, len(frames)):
-        d = calculate_diff(frames[i], ref, roi)
-        di_values.append(d)
-
-    # Calculate statistics
-    if len(di_values) == 0:
-        # Edge case: only one frame captured
-        mu = 0.0
-        sigma = 0.0
-    else:
-        mu = float(np.mean(di_values))
-        sigma = float(np.std(di_values))
+    # First frame is the reference
+    ref = capture_roi_gray(roi)
 
-    # Calculate recommended threshold (Spec 8.3)
-    raw_th = mu + 3 * sigma
+    # The circle mask and its pixel count only depend on the frame shape,
+    # resolve them once
+    diff_kernel = make_diff_kernel(roi, ref.shape)
+
+    # Diff each subsequent frame against the reference as it arrives,
+    # so only one frame besides the reference is alive at a time
+    di = _DI_BUF[:k_frames - 1]
+    for i in range(1, k_frames):
+        time.sleep(interval_ms / 1000.0)
+        di[i - 1] = diff_kernel(capture_roi_gray(roi), ref)
+    di_values: list[float] = di.tolist()
+
+    # Calculate statistics and recommended threshold (Spec 8.3)
+    mu, sigma, th_rec = _mu_sigma_th(di_values, TH_HOLD_MIN, TH_HOLD_MAX)
 
     # Check for warning condition
     warning: Optional[str] = None
-    if raw_th > TH_HOLD_MAX:
+    if mu + 3 * sigma > TH_HOLD_MAX:
         warning = "噪声异常,建议重新选择ROI"
 
-    # Clamp to valid range
-    th_rec = clamp(raw_th, TH_HOLD_MIN, TH_HOLD_MAX)
-
     return CalibrationStats(
         mu=mu,
         sigma=sigma,
@@ -220,6 +462,10 @@ class HoldHitsTracker:
     - Reset counter to 0 when diff < threshold
     """
 
+    # update() runs once per captured frame; slots make its attribute
+    # reads and writes cheaper and keep instances small
+    __slots__ = ("_required_hits", "_hold_hits")
+
     def __init__(self, required_hits: int = 2) -> None:
         """Initialize the tracker.
 
@@ -249,11 +495,10 @@ class HoldHitsTracker:
         Returns:
             True if consecutive hits requirement is met, False otherwise
         """
-        if diff >= threshold:
-            self._hold_hits += 1
-        else:
-            # Reset on miss (Spec 7.2)
-            self._hold_hits = 0
+        # Branchless: a hit extends the streak, a miss resets it to 0 (Spec 7.2).
+        # bool() keeps the counter a plain int when diff is a numpy scalar.
+        hit = bool(diff >= threshold)
+        self._hold_hits = (self._hold_hits + 1) * hit
 
         return self._hold_hits >= self._required_hits
 
@@ -262,6 +507,22 @@ class HoldHitsTracker:
         self._hold_hits = 0
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class FrozenDiffState:
+    """DiffCalculator state saved on pause (Spec Section 10).
+
+    Compared and hashed by identity: the generated field-wise __eq__
+    would compare arrays elementwise and fail on the ndarray field.
+
+    Attributes:
+        frame_t0: Copy of the reference frame, or None if not captured
+        hold_hits: Consecutive hits at the time of the pause
+    """
+
+    frame_t0: Optional[np.ndarray]
+    hold_hits: int = 0
+
+
 class DiffCalculator:
     """High-level diff calculation interface.
 
@@ -280,6 +541,8 @@ class DiffCalculator:
         self._threshold = threshold
         self._frame_t0: Optional[np.ndarray] = None
         self._tracker = HoldHitsTracker()
+        # Diff function specialized for the ROI and reference frame shape
+        self._kernel: Optional[Callable[[np.ndarray, np.ndarray], float]] = None
 
     @property
     def roi(self) -> ROI:
@@ -313,6 +576,7 @@ class DiffCalculator:
             The captured reference frame
         """
         self._frame_t0 = capture_roi_gray(self._roi)
+        self._kernel = make_diff_kernel(self._roi, self._frame_t0.shape)
         self._tracker.reset()
         return self._frame_t0
 
@@ -323,6 +587,7 @@ class DiffCalculator:
             frame: Reference frame to use
         """
         self._frame_t0 = frame
+        self._kernel = make_diff_kernel(self._roi, frame.shape)
         self._tracker.reset()
 
     def sample(self) -> tuple[float, bool]:
@@ -335,11 +600,11 @@ class DiffCalculator:
         Raises:
             ValueError: If reference frame not set
         """
-        if self._frame_t0 is None:
+        if self._frame_t0 is None or self._kernel is None:
             raise ValueError("Reference frame not set. Call capture_reference() first.")
 
         frame_t = capture_roi_gray(self._roi)
-        diff = calculate_diff(frame_t, self._frame_t0, self._roi)
+        diff = self._kernel(frame_t, self._frame_t0)
         passed = self._tracker.update(diff, self._threshold)
 
         return diff, passed
@@ -347,6 +612,7 @@ class DiffCalculator:
     def reset(self) -> None:
         """Reset the calculator state."""
         self._frame_t0 = None
+        self._kernel = None
         self._tracker.reset()
 
     def calibrate(
@@ -365,24 +631,29 @@ class DiffCalculator:
         """
         return calibrate_threshold(self._roi, k_frames, interval_ms)
 
-    def freeze_state(self) -> dict:
+    def freeze_state(self) -> FrozenDiffState:
         """Freeze current state for pause/resume.
 
         Returns:
-            Dictionary with frame_t0 and hold_hits for later restore
+            FrozenDiffState with frame_t0 and hold_hits for later restore
         """
-        return {
-            "frame_t0": self._frame_t0.copy() if self._frame_t0 is not None else None,
-            "hold_hits": self._tracker.hold_hits,
-        }
+        return FrozenDiffState(
+            self._frame_t0.copy() if self._frame_t0 is not None else None,
+            self._tracker.hold_hits,
+        )
 
-    def restore_state(self, state: dict) -> None:
+    def restore_state(self, state: FrozenDiffState) -> None:
         """Restore state from freeze_state().
 
         Args:
-            state: State dictionary from freeze_state()
+            state: State from freeze_state()
         """
-        self._frame_t0 = state.get("frame_t0")
-        self._tracker._hold_hits = state.get("hold_hits", 0)
+        self._frame_t0 = state.frame_t0
+        self._kernel = (
+            make_diff_kernel(self._roi, self._frame_t0.shape)
+            if self._frame_t0 is not None
+            else None
+        )
+        self._tracker._hold_hits = state.hold_hits
 
 
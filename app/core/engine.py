@@ -40,7 +40,7 @@ from .constants import (
     T_COUNTDOWN_SEC,
     TH_HOLD_DEFAULT,
 )
-from .diff import calculate_diff, calibrate_threshold
+from .diff import calibrate_threshold, make_diff_kernel
 from .logging import Logger, get_logger
 from .model import CalibrationConfig, CalibrationStats, Point, ROI, State
 from .os_adapter.input_inject import click_point, paste_text
@@ -313,6 +313,8 @@ class AutomationWorker(QObject):
             _log_debug("engine.py:after_capture_t0", "Captured frame_t0", {"idx": idx, "shape": list(frame_t0.shape)}, "A")
             # #endregion
             self._hold_hits = 0
+            # Resolve ROI shape and circle mask once for this message's samples
+            diff_kernel = make_diff_kernel(roi, frame_t0.shape)
             self._logger.info("采集frame_t0", frame_shape=f"{frame_t0.shape}", idx=idx)
             # #region agent log
             _log_debug("engine.py:before_logger_info_frame_t0", "About to log frame_t0", {"idx": idx}, "J")
@@ -369,7 +371,7 @@ class AutomationWorker(QObject):
                 _log_debug("engine.py:before_calculate_diff", "About to calculate diff", {"idx": idx}, "H")
                 # #endregion
                 try:
-                    diff = calculate_diff(frame_t, frame_t0, roi)
+                    diff = diff_kernel(frame_t, frame_t0)
                 except Exception as e:
                     self._logger.exception("计算diff失败", e, idx=idx, loop_iteration=loop_count)
                     raise
@@ -541,10 +543,10 @@ class AutomationEngine(QObject):
         self._logger = get_logger()
         self._config: Optional[CalibrationConfig] = None
         self._messages: list[str] = []
-        self._messages_snapshot: Optional[list[str]] = None
+        self._messages_snapshot: Optional[bytes] = None
 
-        # Callback for message change detection
-        self._get_current_messages: Optional[Callable[[], list[str]]] = None
+        # Callback for message change detection (returns a content digest)
+        self._get_current_messages: Optional[Callable[[], bytes]] = None
 
     @property
     def is_running(self) -> bool:
@@ -560,12 +562,12 @@ class AutomationEngine(QObject):
 
     def set_message_getter(
         self,
-        getter: Callable[[], list[str]],
+        getter: Callable[[], bytes],
     ) -> None:
-        """Set callback to get current messages from UI.
+        """Set callback to get current messages snapshot from UI.
 
         Args:
-            getter: Function that returns current message list
+            getter: Function that returns a digest of the current message list
         """
         self._get_current_messages = getter
 
@@ -593,7 +595,9 @@ class AutomationEngine(QObject):
 
         self._messages = messages
         self._config = config
-        self._messages_snapshot = messages.copy()
+        self._messages_snapshot = (
+            self._get_current_messages() if self._get_current_messages else None
+        )
 
         # Create worker
         self._worker = AutomationWorker(messages, config, self._logger)
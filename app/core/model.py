@@ -6,8 +6,11 @@ and state machine enums as specified in the TDD and Executable Spec.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import cached_property, lru_cache
 from typing import Literal, Optional
 
+import numpy as np
+
 from .constants import TH_HOLD_DEFAULT
 
 
@@ -91,7 +94,7 @@ class Point:
         return (self.x, self.y)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     """A rectangle in virtual desktop coordinates.
 
@@ -132,7 +135,7 @@ class Rect:
         return self.w > 0 and self.h > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Circle:
     """A circle derived from a bounding rectangle.
 
@@ -149,19 +152,46 @@ class Circle:
     r: float
 
     @classmethod
+    @lru_cache(maxsize=128)
     def from_rect(cls, rect: Rect) -> "Circle":
-        """Create inscribed circle from bounding rectangle (Spec 4.2)."""
+        """Create inscribed circle from bounding rectangle (Spec 4.2).
+
+        Rect and Circle are frozen, so results are cached per rect.
+        """
         cx = rect.x + rect.w / 2
         cy = rect.y + rect.h / 2
         r = min(rect.w, rect.h) / 2
         return cls(cx=cx, cy=cy, r=r)
 
     def contains_point(self, x: float, y: float) -> bool:
-        """Check if point (x, y) is inside the circle."""
-        return (x - self.cx) ** 2 + (y - self.cy) ** 2 <= self.r ** 2
-
-
-@dataclass
+        """Check if point (x, y) is inside the circle.
+
+        Scalar check; use mask() for whole pixel grids.
+        """
+        dx = x - self.cx
+        dy = y - self.cy
+        return dx * dx + dy * dy <= self.r * self.r
+
+    def mask(self, height: int, width: int, x0: float = 0, y0: float = 0) -> np.ndarray:
+        """Vectorized contains_point over a pixel grid.
+
+        Args:
+            height: Grid height in pixels
+            width: Grid width in pixels
+            x0: X coordinate of the grid's left column
+            y0: Y coordinate of the grid's top row
+
+        Returns:
+            Boolean array of shape (height, width), True where the pixel
+            at (x0 + col, y0 + row) is inside the circle
+        """
+        ys, xs = np.ogrid[:height, :width]
+        dx = xs + (x0 - self.cx)
+        dy = ys + (y0 - self.cy)
+        return dx * dx + dy * dy <= self.r * self.r
+
+
+@dataclass(frozen=True, slots=True)
 class ROI:
     """Region of Interest for change detection.
 
@@ -186,10 +216,12 @@ class ROI:
         return self.rect.is_valid()
 
 
-@dataclass
+@dataclass(frozen=True)
 class CalibrationConfig:
     """Calibration configuration for a single run.
 
+    Frozen (and hashable) so validation results can be memoized per config.
+
     Attributes:
         roi: Region of interest for change detection
         input_point: Click point to grab focus
@@ -212,10 +244,13 @@ class CalibrationConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class VirtualDesktopInfo:
     """Information about the virtual desktop (all monitors combined).
 
+    Immutable, so the derived edges are computed once on first use
+    rather than on every bounds check.
+
     Attributes:
         left: Leftmost X coordinate (may be negative)
         top: Topmost Y coordinate (may be negative)
@@ -228,30 +263,39 @@ class VirtualDesktopInfo:
     width: int
     height: int
 
-    @property
+    @cached_property
     def right(self) -> int:
         """Rightmost X coordinate."""
         return self.left + self.width
 
-    @property
+    @cached_property
     def bottom(self) -> int:
         """Bottommost Y coordinate."""
         return self.top + self.height
 
+    @cached_property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """(left, top, right, bottom) edges."""
+        return (self.left, self.top, self.right, self.bottom)
+
     def contains_point(self, point: Point) -> bool:
         """Check if point is within virtual desktop bounds."""
-        return (self.left <= point.x < self.right and
-                self.top <= point.y < self.bottom)
+        left, top, right, bottom = self.bounds
+        return left <= point.x < right and top <= point.y < bottom
 
     def contains_rect(self, rect: Rect) -> bool:
         """Check if rect is entirely within virtual desktop bounds."""
-        return (self.left <= rect.x and
-                self.top <= rect.y and
-                rect.right <= self.right and
-                rect.bottom <= self.bottom)
+        left, top, right, bottom = self.bounds
+        # Read the rect's fields directly instead of its right/bottom
+        # properties; no corner points are materialized
+        x, y = rect.x, rect.y
+        return (left <= x and
+                top <= y and
+                x + rect.w <= right and
+                y + rect.h <= bottom)
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationStats:
     """Statistics from threshold calibration.
 
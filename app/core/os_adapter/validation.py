@@ -6,40 +6,70 @@ the virtual desktop bounds before starting automation.
 See Executable Spec Section 4.4 for requirements.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Optional
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional, Union
+
+import numpy as np
 
 from ..model import CalibrationConfig, Point, Rect, ROI, VirtualDesktopInfo
 from . import get_virtual_desktop_info
 
 
-@dataclass
+class ValidationErrorCode(IntEnum):
+    """Machine-readable reason for a validation failure."""
+
+    ROI_WIDTH_NON_POSITIVE = 1
+    ROI_HEIGHT_NON_POSITIVE = 2
+    POINT_OUT_OF_BOUNDS = 3
+    RECT_OUT_OF_BOUNDS = 4
+    INPUT_POINT_OUT_OF_BOUNDS = 5
+    SEND_POINT_OUT_OF_BOUNDS = 6
+    MACOS_MULTIPLE_DISPLAYS = 7
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of a validation check.
 
+    Immutable, so the success result is a shared singleton and results
+    can be cached and handed out without copying.
+
     Attributes:
         valid: True if validation passed
-        errors: List of error messages if validation failed
+        errors: Error messages if validation failed
+        codes: Error codes, parallel to errors, for callers that need
+            to tell failures apart without matching message text
     """
 
     valid: bool
-    errors: list[str]
+    errors: tuple[str, ...] = ()
+    codes: tuple[ValidationErrorCode, ...] = ()
 
     @classmethod
     def success(cls) -> "ValidationResult":
-        """Create a successful validation result."""
-        return cls(valid=True, errors=[])
+        """Return the shared successful validation result."""
+        return _SUCCESS
 
     @classmethod
-    def failure(cls, *errors: str) -> "ValidationResult":
-        """Create a failed validation result with error messages."""
-        return cls(valid=False, errors=list(errors))
+    def failure(
+        cls,
+        *errors: str,
+        codes: Sequence[ValidationErrorCode] = (),
+    ) -> "ValidationResult":
+        """Create a failed validation result with error messages and codes."""
+        return cls(valid=False, errors=errors, codes=tuple(codes))
 
     def __bool__(self) -> bool:
         """Allow using result in boolean context."""
         return self.valid
 
 
+_SUCCESS = ValidationResult(valid=True)
+
+
 def validate_point_in_bounds(
     point: Point,
     name: str,
@@ -60,13 +90,47 @@ def validate_point_in_bounds(
 
     if not desktop.contains_point(point):
         return ValidationResult.failure(
-            f"{name}坐标 ({point.x}, {point.y}) 超出虚拟桌面范围 "
-            f"[{desktop.left}, {desktop.top}] - [{desktop.right}, {desktop.bottom}]"
+            _point_out_of_bounds(point, name, desktop),
+            codes=(ValidationErrorCode.POINT_OUT_OF_BOUNDS,),
         )
 
     return ValidationResult.success()
 
 
+def _point_out_of_bounds(point: Point, name: str, desktop: VirtualDesktopInfo) -> str:
+    """Build the error message for a point outside the virtual desktop."""
+    return (
+        f"{name}坐标 ({point.x}, {point.y}) 超出虚拟桌面范围 "
+        f"[{desktop.left}, {desktop.top}] - [{desktop.right}, {desktop.bottom}]"
+    )
+
+
+def validate_points_batch(
+    points: Union[np.ndarray, Sequence[tuple[int, int]]],
+    desktop: Optional[VirtualDesktopInfo] = None,
+) -> np.ndarray:
+    """Check several points against virtual desktop bounds in one pass.
+
+    Uses the same half-open bounds as validate_point_in_bounds:
+    left <= x < right and top <= y < bottom.
+
+    Args:
+        points: (N, 2) array-like of (x, y) coordinates
+        desktop: Virtual desktop info (fetched automatically if None)
+
+    Returns:
+        Boolean array of shape (N,), True where the point is inside
+    """
+    if desktop is None:
+        desktop = get_virtual_desktop_info()
+
+    left, top, right, bottom = desktop.bounds
+    pts = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    x = pts[:, 0]
+    y = pts[:, 1]
+    return (x >= left) & (x < right) & (y >= top) & (y < bottom)
+
+
 def validate_rect_in_bounds(
     rect: Rect,
     name: str,
@@ -87,12 +151,40 @@ def validate_rect_in_bounds(
 
     if not desktop.contains_rect(rect):
         return ValidationResult.failure(
-            f"{name}区域 ({rect.x}, {rect.y}, {rect.w}x{rect.h}) 超出虚拟桌面范围"
+            f"{name}区域 ({rect.x}, {rect.y}, {rect.w}x{rect.h}) 超出虚拟桌面范围",
+            codes=(ValidationErrorCode.RECT_OUT_OF_BOUNDS,),
         )
 
     return ValidationResult.success()
 
 
+def validate_rects_batch(
+    rects: Union[np.ndarray, Sequence[tuple[int, int, int, int]]],
+    desktop: Optional[VirtualDesktopInfo] = None,
+) -> np.ndarray:
+    """Check several rectangles against virtual desktop bounds in one pass.
+
+    Same rule as validate_rect_in_bounds: each rect must lie entirely
+    inside the desktop, touching its edges is allowed. The four edge
+    comparisons become two vector subtractions and one sign test.
+
+    Args:
+        rects: (N, 4) array-like of (x, y, w, h)
+        desktop: Virtual desktop info (fetched automatically if None)
+
+    Returns:
+        Boolean array of shape (N,), True where the rect is inside
+    """
+    if desktop is None:
+        desktop = get_virtual_desktop_info()
+
+    left, top, right, bottom = desktop.bounds
+    r = np.asarray(rects, dtype=np.int64).reshape(-1, 4)
+    lo = r[:, :2] - (left, top)                     # x - left, y - top
+    hi = (right, bottom) - (r[:, :2] + r[:, 2:])    # right - x2, bottom - y2
+    return ((lo | hi) >= 0).all(axis=1)
+
+
 def validate_roi(
     roi: ROI,
     desktop: Optional[VirtualDesktopInfo] = None,
@@ -112,15 +204,18 @@ def validate_roi(
         ValidationResult indicating success or failure
     """
     errors: list[str] = []
+    codes: list[ValidationErrorCode] = []
 
     # Check dimensions (Spec 4.4)
     if roi.rect.w <= 0:
         errors.append("ROI宽度必须大于0")
+        codes.append(ValidationErrorCode.ROI_WIDTH_NON_POSITIVE)
     if roi.rect.h <= 0:
         errors.append("ROI高度必须大于0")
+        codes.append(ValidationErrorCode.ROI_HEIGHT_NON_POSITIVE)
 
     if errors:
-        return ValidationResult.failure(*errors)
+        return ValidationResult.failure(*errors, codes=codes)
 
     # Check bounds
     return validate_rect_in_bounds(roi.rect, "ROI", desktop)
@@ -148,29 +243,43 @@ def validate_calibration_config(
     if desktop is None:
         desktop = get_virtual_desktop_info()
 
+    return _validate_calibration_config_cached(config, desktop)
+
+
+@lru_cache(maxsize=64)
+def _validate_calibration_config_cached(
+    config: CalibrationConfig,
+    desktop: VirtualDesktopInfo,
+) -> ValidationResult:
+    """Run the config checks, memoized on (config, desktop).
+
+    Both arguments and the result are frozen dataclasses, so equal
+    inputs hash equal and the cached result can be shared.
+    """
     all_errors: list[str] = []
+    all_codes: list[ValidationErrorCode] = []
 
     # Validate ROI
     roi_result = validate_roi(config.roi, desktop)
     if not roi_result.valid:
         all_errors.extend(roi_result.errors)
+        all_codes.extend(roi_result.codes)
 
-    # Validate input point
-    input_result = validate_point_in_bounds(
-        config.input_point, "输入点", desktop
+    # Validate input and send points together
+    named_points = (
+        (config.input_point, "输入点", ValidationErrorCode.INPUT_POINT_OUT_OF_BOUNDS),
+        (config.send_point, "发送点", ValidationErrorCode.SEND_POINT_OUT_OF_BOUNDS),
     )
-    if not input_result.valid:
-        all_errors.extend(input_result.errors)
-
-    # Validate send point
-    send_result = validate_point_in_bounds(
-        config.send_point, "发送点", desktop
+    inside = validate_points_batch(
+        [(point.x, point.y) for point, _, _ in named_points], desktop
     )
-    if not send_result.valid:
-        all_errors.extend(send_result.errors)
+    for (point, name, code), ok in zip(named_points, inside.tolist()):
+        if not ok:
+            all_errors.append(_point_out_of_bounds(point, name, desktop))
+            all_codes.append(code)
 
     if all_errors:
-        return ValidationResult.failure(*all_errors)
+        return ValidationResult.failure(*all_errors, codes=all_codes)
 
     return ValidationResult.success()
 
@@ -191,7 +300,8 @@ def check_macos_display_limit() -> ValidationResult:
     screen_count = get_screen_count()
     if screen_count > 1:
         return ValidationResult.failure(
-            f"macOS版本仅支持单显示器环境,当前检测到{screen_count}个显示器"
+            f"macOS版本仅支持单显示器环境,当前检测到{screen_count}个显示器",
+            codes=(ValidationErrorCode.MACOS_MULTIPLE_DISPLAYS,),
         )
 
     return ValidationResult.success()
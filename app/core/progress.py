@@ -0,0 +1,19 @@
+"""Progress text formatting.
+
+Builds the 1-based "i/N" progress texts shown while sending messages.
+See Executable Spec Section 5.1 for requirements.
+"""
+
+
+def progress_labels(total: int) -> list[str]:
+    """Build the progress text for every message in one pass.
+
+    Message index i (0-based) is displayed as f"{i + 1}/{total}".
+
+    Args:
+        total: Total message count (N)
+
+    Returns:
+        List of "1/N" .. "N/N"; empty if total <= 0
+    """
+    return [f"{i}/{total}" for i in range(1, total + 1)]
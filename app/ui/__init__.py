@@ -10,7 +10,12 @@ This package provides PySide6-based UI components:
 
 from .calibration_overlay import CalibrationMode, CalibrationOverlay
 from .main_window import MainWindow
-from .message_editor import MessageEditor, MessageListItem, MessageTextEdit
+from .message_editor import (
+    MessageEditor,
+    MessageItemDelegate,
+    MessagesModel,
+    MessageTextEdit,
+)
 from .run_panel import LogView, RunPanel
 from .widgets import (
     ControlButtons,
@@ -30,7 +35,8 @@ __all__ = [
     "LogView",
     # Message editor
     "MessageEditor",
-    "MessageListItem",
+    "MessagesModel",
+    "MessageItemDelegate",
     "MessageTextEdit",
     # Calibration
     "CalibrationOverlay",
@@ -9,17 +9,20 @@ See Executable Spec Section 4 for requirements.
 """
 
 from enum import Enum, auto
-from typing import Optional
+from typing import Callable, Optional
 
-from PySide6.QtCore import QPoint, QRect, Qt, Signal
+import numpy as np
+from PySide6.QtCore import QPoint, QRect, QRectF, Qt, Signal
 from PySide6.QtGui import (
     QColor,
     QFont,
     QKeyEvent,
     QMouseEvent,
     QPainter,
-    QPainterPath,
     QPen,
+    QPixmap,
+    QRegion,
+    QResizeEvent,
 )
 from PySide6.QtWidgets import QApplication, QWidget
 
@@ -46,11 +49,12 @@ class CalibrationOverlay(QWidget):
     """
 
     # Signals
-    roi_selected = Signal(ROI)
-    input_point_selected = Signal(Point)
-    send_point_selected = Signal(Point)
+    selected = Signal(object, object)  # CalibrationMode, ROI | Point
     cancelled = Signal()
 
+    # Half-length of point marker crosshair arms
+    _MARKER_SIZE = 15
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
@@ -73,38 +77,56 @@ class CalibrationOverlay(QWidget):
         self._input_point: Optional[Point] = None
         self._send_point: Optional[Point] = None
 
+        # Point markers as parallel arrays (global coordinates)
+        self._marker_xs = np.empty(0, dtype=np.int32)
+        self._marker_ys = np.empty(0, dtype=np.int32)
+        self._marker_labels: list[str] = []
+        self._marker_colors: list[QColor] = []
+
         # Instructions text
         self._instructions = ""
 
-    def start_roi_selection(self, shape: ROIShape = ROIShape.RECT) -> None:
-        """Start ROI selection mode.
+        # Back-buffer for layers that don't change during a drag
+        # (dark fill, instructions bar, existing point markers)
+        self._static_bg: Optional[QPixmap] = None
+
+        # Mode-specific paint routine, None when no calibration is active
+        self._paint_fn: Optional[Callable[[QPainter, QRect], None]] = None
+
+    def start(
+        self,
+        mode: CalibrationMode,
+        shape: ROIShape = ROIShape.RECT,
+    ) -> None:
+        """Start a calibration mode.
 
         Args:
-            shape: ROI shape (RECT or CIRCLE)
+            mode: Calibration mode to enter (ROI, INPUT_POINT or SEND_POINT)
+            shape: ROI shape (RECT or CIRCLE), only used in ROI mode
         """
-        self._mode = CalibrationMode.ROI
-        self._roi_shape = shape
-        self._is_dragging = False
-        self._drag_start = None
-        self._drag_current = None
+        self._mode = mode
 
-        if shape == ROIShape.RECT:
-            self._instructions = "拖拽选择矩形ROI区域 | ESC取消 | Enter确认"
+        if mode == CalibrationMode.ROI:
+            self._roi_shape = shape
+            self._is_dragging = False
+            self._drag_start = None
+            self._drag_current = None
+            if shape == ROIShape.RECT:
+                self._instructions = "拖拽选择矩形ROI区域 | ESC取消 | Enter确认"
+            else:
+                self._instructions = "拖拽选择圆形ROI区域(内切圆) | ESC取消 | Enter确认"
+            self._paint_fn = self._paint_roi_mode
+        elif mode == CalibrationMode.INPUT_POINT:
+            self._instructions = "点击选择输入点(用于抢焦点) | ESC取消"
+            self._paint_fn = self._paint_point_mode
+        elif mode == CalibrationMode.SEND_POINT:
+            self._instructions = "点击选择发送按钮位置 | ESC取消"
+            self._paint_fn = self._paint_point_mode
         else:
-            self._instructions = "拖拽选择圆形ROI区域(内切圆) | ESC取消 | Enter确认"
-
-        self._show_fullscreen()
-
-    def start_input_point_selection(self) -> None:
-        """Start input point selection mode."""
-        self._mode = CalibrationMode.INPUT_POINT
-        self._instructions = "点击选择输入点(用于抢焦点) | ESC取消"
-        self._show_fullscreen()
+            self._paint_fn = None
+            return
 
-    def start_send_point_selection(self) -> None:
-        """Start send point selection mode."""
-        self._mode = CalibrationMode.SEND_POINT
-        self._instructions = "点击选择发送按钮位置 | ESC取消"
+        self._static_bg = None
         self._show_fullscreen()
 
     def _show_fullscreen(self) -> None:
@@ -117,28 +139,97 @@ class CalibrationOverlay(QWidget):
         self.activateWindow()
         self.setFocus()
 
-    def paintEvent(self, event) -> None:
-        """Paint the overlay."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _build_static_bg(self) -> QPixmap:
+        """Compose the static overlay layers into a back-buffer pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
 
         # Semi-transparent dark background
         painter.fillRect(self.rect(), QColor(0, 0, 0, 128))
 
-        # Draw current selection
-        if self._mode == CalibrationMode.ROI and self._drag_start and self._drag_current:
-            self._draw_roi_selection(painter)
-        elif self._mode in (CalibrationMode.INPUT_POINT, CalibrationMode.SEND_POINT):
-            self._draw_crosshair(painter)
-
         # Draw instructions
         self._draw_instructions(painter)
 
-        # Draw existing points
-        if self._input_point:
-            self._draw_point_marker(painter, self._input_point, "输入点", QColor(0, 255, 0))
-        if self._send_point:
-            self._draw_point_marker(painter, self._send_point, "发送点", QColor(255, 0, 0))
+        # Draw existing points that fall inside the widget
+        geom = self.geometry()
+        xs = self._marker_xs - geom.x()
+        ys = self._marker_ys - geom.y()
+        margin = self._MARKER_SIZE
+        visible = (
+            (xs >= -margin) & (xs < self.width() + margin) &
+            (ys >= -margin) & (ys < self.height() + margin)
+        )
+        for i in np.flatnonzero(visible):
+            self._draw_point_marker(
+                painter,
+                int(xs[i]),
+                int(ys[i]),
+                self._marker_labels[i],
+                self._marker_colors[i],
+            )
+
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event) -> None:
+        """Paint the overlay."""
+        # Ignore stray repaints while hidden/hiding or outside a calibration
+        if (
+            self._paint_fn is None
+            or not self.isVisible()
+            or event.region().isEmpty()
+        ):
+            return
+
+        if self._static_bg is None:
+            self._static_bg = self._build_static_bg()
+
+        painter = QPainter(self)
+        self._paint_fn(painter, event.rect())
+
+    def _blit_static_bg(self, painter: QPainter, rect: QRect) -> None:
+        """Blit the exposed part of the cached static layers."""
+        dpr = self._static_bg.devicePixelRatio()  # type: ignore
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        painter.drawPixmap(QRectF(rect), self._static_bg, source)  # type: ignore
+
+    def _paint_roi_mode(self, painter: QPainter, rect: QRect) -> None:
+        """Paint routine for ROI selection mode."""
+        if not self._drag_start or not self._drag_current:
+            self._blit_static_bg(painter, rect)
+            return
+
+        sel_rect = self._get_selection_rect()
+        if sel_rect.width() <= 0 or sel_rect.height() <= 0:
+            self._blit_static_bg(painter, rect)
+            return
+
+        # Cut the ROI area out of the dark layer (make it transparent)
+        hole = self._get_hole_region(sel_rect)
+        painter.setClipRegion(QRegion(rect).subtracted(hole))
+        self._blit_static_bg(painter, rect)
+
+        # Fully transparent pixels are click-through on some platforms,
+        # keep a near-invisible fill so a new drag can start inside the hole
+        painter.setClipRegion(hole)
+        painter.fillRect(hole.boundingRect(), QColor(0, 0, 0, 1))
+        painter.setClipping(False)
+
+        self._draw_roi_selection(painter)
+
+    def _paint_point_mode(self, painter: QPainter, rect: QRect) -> None:
+        """Paint routine for input/send point selection modes."""
+        self._blit_static_bg(painter, rect)
+        self._draw_crosshair(painter)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Drop the back-buffer so it is rebuilt at the new size."""
+        super().resizeEvent(event)
+        self._static_bg = None
 
     def _draw_roi_selection(self, painter: QPainter) -> None:
         """Draw the ROI selection rectangle/circle."""
@@ -149,23 +240,8 @@ class CalibrationOverlay(QWidget):
         if rect.width() <= 0 or rect.height() <= 0:
             return
 
-        # Clear the ROI area (make it transparent)
         painter.save()
 
-        # Create a path for the overlay with hole
-        overlay_path = QPainterPath()
-        overlay_path.addRect(self.rect())
-
-        hole_path = QPainterPath()
-        if self._roi_shape == ROIShape.CIRCLE:
-            # Draw inscribed circle
-            cx = rect.x() + rect.width() / 2
-            cy = rect.y() + rect.height() / 2
-            r = min(rect.width(), rect.height()) / 2
-            hole_path.addEllipse(cx - r, cy - r, r * 2, r * 2)
-        else:
-            hole_path.addRect(rect)
-
         # Draw selection border
         pen = QPen(QColor(0, 255, 255), 2)
         pen.setStyle(Qt.PenStyle.DashLine)
@@ -176,7 +252,10 @@ class CalibrationOverlay(QWidget):
             cx = rect.x() + rect.width() / 2
             cy = rect.y() + rect.height() / 2
             r = min(rect.width(), rect.height()) / 2
+            # Only the ellipse needs antialiasing; fills and lines stay on the fast path
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             painter.drawEllipse(QPoint(int(cx), int(cy)), int(r), int(r))
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
             # Also draw bounding rect for reference
             painter.setPen(QPen(QColor(128, 128, 128), 1, Qt.PenStyle.DotLine))
             painter.drawRect(rect)
@@ -214,7 +293,7 @@ class CalibrationOverlay(QWidget):
         # Get global position for display
         global_pos = self.cursor().pos()
         coord_text = f"({global_pos.x()}, {global_pos.y()})"
-        painter.drawText(cursor_pos + QPoint(10, -10), coord_text)
+        painter.drawText(cursor_pos.x() + 10, cursor_pos.y() - 10, coord_text)
 
         painter.restore()
 
@@ -235,29 +314,43 @@ class CalibrationOverlay(QWidget):
 
         painter.restore()
 
+    def _update_markers(self) -> None:
+        """Rebuild the marker arrays from the existing points."""
+        markers = [
+            (point, label, color)
+            for point, label, color in (
+                (self._input_point, "输入点", QColor(0, 255, 0)),
+                (self._send_point, "发送点", QColor(255, 0, 0)),
+            )
+            if point is not None
+        ]
+        self._marker_xs = np.array([m[0].x for m in markers], dtype=np.int32)
+        self._marker_ys = np.array([m[0].y for m in markers], dtype=np.int32)
+        self._marker_labels = [m[1] for m in markers]
+        self._marker_colors = [m[2] for m in markers]
+        self._static_bg = None
+
     def _draw_point_marker(
         self,
         painter: QPainter,
-        point: Point,
+        local_x: int,
+        local_y: int,
         label: str,
         color: QColor,
     ) -> None:
-        """Draw a marker for a selected point."""
-        # Convert to local coordinates
-        local_x = point.x - self.geometry().x()
-        local_y = point.y - self.geometry().y()
-
+        """Draw a marker for a selected point (in local coordinates)."""
         painter.save()
 
         # Draw crosshair
         pen = QPen(color, 2)
         painter.setPen(pen)
-        size = 15
+        size = self._MARKER_SIZE
         painter.drawLine(local_x - size, local_y, local_x + size, local_y)
         painter.drawLine(local_x, local_y - size, local_x, local_y + size)
 
         # Draw circle
-        painter.drawEllipse(QPoint(local_x, local_y), 5, 5)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawEllipse(local_x - 5, local_y - 5, 10, 10)
 
         # Draw label
         font = QFont()
@@ -267,6 +360,16 @@ class CalibrationOverlay(QWidget):
 
         painter.restore()
 
+    def _get_hole_region(self, rect: QRect) -> QRegion:
+        """Get the transparent cut-out region for a selection rectangle."""
+        if self._roi_shape == ROIShape.CIRCLE:
+            # Inscribed circle
+            r = min(rect.width(), rect.height()) // 2
+            cx = rect.x() + rect.width() // 2
+            cy = rect.y() + rect.height() // 2
+            return QRegion(cx - r, cy - r, r * 2, r * 2, QRegion.RegionType.Ellipse)
+        return QRegion(rect)
+
     def _get_selection_rect(self) -> QRect:
         """Get the current selection rectangle."""
         if not self._drag_start or not self._drag_current:
@@ -293,12 +396,14 @@ class CalibrationOverlay(QWidget):
             elif self._mode == CalibrationMode.INPUT_POINT:
                 global_pos = event.globalPos()
                 self._input_point = Point(global_pos.x(), global_pos.y())
-                self.input_point_selected.emit(self._input_point)
+                self._update_markers()
+                self.selected.emit(self._mode, self._input_point)
                 self.hide()
             elif self._mode == CalibrationMode.SEND_POINT:
                 global_pos = event.globalPos()
                 self._send_point = Point(global_pos.x(), global_pos.y())
-                self.send_point_selected.emit(self._send_point)
+                self._update_markers()
+                self.selected.emit(self._mode, self._send_point)
                 self.hide()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
@@ -326,6 +431,7 @@ class CalibrationOverlay(QWidget):
     def _cancel(self) -> None:
         """Cancel calibration."""
         self._mode = CalibrationMode.NONE
+        self._paint_fn = None
         self._is_dragging = False
         self._drag_start = None
         self._drag_current = None
@@ -347,7 +453,7 @@ class CalibrationOverlay(QWidget):
                 )
                 roi = ROI(shape=self._roi_shape, rect=global_rect)
                 self._current_roi = roi
-                self.roi_selected.emit(roi)
+                self.selected.emit(self._mode, roi)
                 self.hide()
 
     def set_existing_points(
@@ -363,6 +469,7 @@ class CalibrationOverlay(QWidget):
         """
         self._input_point = input_point
         self._send_point = send_point
+        self._update_markers()
 
     @property
     def current_roi(self) -> Optional[ROI]:
@@ -8,7 +8,8 @@ Combines all UI components into the main application window:
 See TDD Section 9 for UI requirements.
 """
 
-from typing import Optional
+from functools import partial
+from typing import Optional, Union
 
 from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import (
@@ -23,7 +24,7 @@ from PySide6.QtWidgets import (
 from app.core.logging import LogBuffer, Logger, get_logger
 from app.core.model import CalibrationConfig, Point, ROI, ROIShape, State
 
-from .calibration_overlay import CalibrationOverlay
+from .calibration_overlay import CalibrationMode, CalibrationOverlay
 from .message_editor import MessageEditor
 from .run_panel import RunPanel
 from .widgets import WarningBanner
@@ -58,9 +59,9 @@ class MainWindow(QMainWindow):
         self._threshold: float = 0.02
         self._logger = get_logger()
         self._dpi_warning: Optional[str] = None
+        self._overlay: Optional[CalibrationOverlay] = None
 
         self._setup_ui()
-        self._setup_calibration_overlay()
         self._connect_signals()
         self._update_calibration_status()
 
@@ -92,18 +93,15 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(splitter)
 
-    def _setup_calibration_overlay(self) -> None:
-        """Setup the calibration overlay."""
-        self._calibration_overlay = CalibrationOverlay()
+    @property
+    def _calibration_overlay(self) -> CalibrationOverlay:
+        """Get the calibration overlay, creating it on first use."""
+        if self._overlay is None:
+            self._overlay = CalibrationOverlay()
 
-        # Connect overlay signals
-        self._calibration_overlay.roi_selected.connect(self._on_roi_selected)
-        self._calibration_overlay.input_point_selected.connect(
-            self._on_input_point_selected
-        )
-        self._calibration_overlay.send_point_selected.connect(
-            self._on_send_point_selected
-        )
+            # Connect overlay signals
+            self._overlay.selected.connect(self._on_calibration_selected)
+        return self._overlay
 
     def _connect_signals(self) -> None:
         """Connect UI signals."""
@@ -114,12 +112,14 @@ class MainWindow(QMainWindow):
         self._run_panel.stop_requested.connect(self.stop_automation.emit)
 
         # Calibration signals
-        self._run_panel.calibrate_roi_requested.connect(self._start_roi_calibration)
+        self._run_panel.calibrate_roi_requested.connect(
+            partial(self._start_calibration, CalibrationMode.ROI)
+        )
         self._run_panel.calibrate_input_requested.connect(
-            self._start_input_point_calibration
+            partial(self._start_calibration, CalibrationMode.INPUT_POINT)
         )
         self._run_panel.calibrate_send_requested.connect(
-            self._start_send_point_calibration
+            partial(self._start_calibration, CalibrationMode.SEND_POINT)
         )
         
         # Set initial calibration status
@@ -136,33 +136,36 @@ class MainWindow(QMainWindow):
 
     # Calibration handlers
 
-    @Slot(ROIShape)
-    def _start_roi_calibration(self, shape: ROIShape) -> None:
-        """Start ROI calibration.
+    def _start_calibration(
+        self,
+        mode: CalibrationMode,
+        shape: ROIShape = ROIShape.RECT,
+    ) -> None:
+        """Start calibration in the overlay.
 
         Args:
-            shape: ROI shape to use (RECT or CIRCLE)
+            mode: Calibration mode to start
+            shape: ROI shape to use (RECT or CIRCLE), only for ROI mode
         """
         self._calibration_overlay.set_existing_points(
             self._input_point, self._send_point
         )
-        self._calibration_overlay.start_roi_selection(shape)
-
-    def _start_input_point_calibration(self) -> None:
-        """Start input point calibration."""
-        self._calibration_overlay.set_existing_points(
-            self._input_point, self._send_point
-        )
-        self._calibration_overlay.start_input_point_selection()
-
-    def _start_send_point_calibration(self) -> None:
-        """Start send point calibration."""
-        self._calibration_overlay.set_existing_points(
-            self._input_point, self._send_point
-        )
-        self._calibration_overlay.start_send_point_selection()
+        self._calibration_overlay.start(mode, shape)
+
+    @Slot(object, object)
+    def _on_calibration_selected(
+        self,
+        mode: CalibrationMode,
+        payload: Union[ROI, Point],
+    ) -> None:
+        """Dispatch a selection from the calibration overlay."""
+        if mode == CalibrationMode.ROI:
+            self._on_roi_selected(payload)  # type: ignore
+        elif mode == CalibrationMode.INPUT_POINT:
+            self._on_input_point_selected(payload)  # type: ignore
+        elif mode == CalibrationMode.SEND_POINT:
+            self._on_send_point_selected(payload)  # type: ignore
 
-    @Slot(ROI)
     def _on_roi_selected(self, roi: ROI) -> None:
         """Handle ROI selection."""
         self._current_roi = roi
@@ -172,14 +175,12 @@ class MainWindow(QMainWindow):
             f"{roi.rect.w}x{roi.rect.h} [{roi.shape.value}]"
         )
 
-    @Slot(Point)
     def _on_input_point_selected(self, point: Point) -> None:
         """Handle input point selection."""
         self._input_point = point
         self._update_calibration_status()
         self._logger.info(f"输入点已设置: ({point.x}, {point.y})")
 
-    @Slot(Point)
     def _on_send_point_selected(self, point: Point) -> None:
         """Handle send point selection."""
         self._send_point = point
@@ -189,6 +190,7 @@ class MainWindow(QMainWindow):
 
     def _update_calibration_status(self) -> None:
         """Update calibration status in run panel."""
+        # RunPanel skips the restyle itself when nothing changed
         self._run_panel.set_calibration_status(
             roi_set=self._current_roi is not None,
             input_set=self._input_point is not None,
@@ -318,11 +320,11 @@ class MainWindow(QMainWindow):
 
     # Message snapshot for pause/resume
 
-    def get_message_snapshot(self) -> list[str]:
-        """Get current message list for snapshot."""
+    def get_message_snapshot(self) -> bytes:
+        """Get current message content digest for snapshot."""
         return self._message_editor.get_snapshot()
 
-    def check_messages_changed(self, snapshot: list[str]) -> bool:
+    def check_messages_changed(self, snapshot: bytes) -> bool:
         """Check if messages changed since snapshot."""
         return self._message_editor.has_changed(snapshot)
 
@@ -3,23 +3,47 @@
 Provides a list-based message editor where each item can contain
 multi-line text. Enter key inserts newlines (not submit).
 
+Rows are backed by a QAbstractListModel and rendered by a delegate,
+so only the row being edited owns a real editor widget.
+
 See Executable Spec Section 5 for requirements.
 """
 
-from typing import Optional
-
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QKeyEvent
+import hashlib
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QHelpEvent, QKeyEvent, QPainter, QPalette
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QLabel,
+    QListView,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionFrame,
+    QStyleOptionViewItem,
     QTextEdit,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
 
+PLACEHOLDER_TEXT = "输入消息内容..."
+
 
 class MessageTextEdit(QTextEdit):
     """Multi-line text editor that captures Enter for newlines.
@@ -29,14 +53,48 @@ class MessageTextEdit(QTextEdit):
 
     # Emitted when focus is lost or editing is done
     editing_finished = Signal()
+    # Emitted once typing pauses or focus is lost (debounced textChanged)
+    content_changed = Signal()
 
-    def __init__(self, parent: Optional[QWidget] = None) -> None:
+    # Height limits of the editor area
+    MIN_HEIGHT = 60
+    MAX_HEIGHT = 150
+
+    # Typing pause before content_changed is emitted
+    DEBOUNCE_MS = 150
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        on_content_changed: Optional[Callable[["MessageTextEdit"], None]] = None,
+    ) -> None:
+        """Initialize the editor.
+
+        Args:
+            parent: Parent widget
+            on_content_changed: Called directly with this editor whenever
+                content_changed is emitted, bypassing signal dispatch
+        """
         super().__init__(parent)
+        self._on_content_changed = on_content_changed
         self.setAcceptRichText(False)
-        self.setPlaceholderText("输入消息内容...")
+        self.setPlaceholderText(PLACEHOLDER_TEXT)
         # Auto-adjust height
-        self.setMinimumHeight(60)
-        self.setMaximumHeight(150)
+        self.setMinimumHeight(self.MIN_HEIGHT)
+        self.setMaximumHeight(self.MAX_HEIGHT)
+
+        # Coalesce keystrokes into a single content_changed
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._notify_content_changed)
+        self.textChanged.connect(self._debounce.start)
+
+    def _notify_content_changed(self) -> None:
+        """Report changed content to the owner, then to external listeners."""
+        if self._on_content_changed is not None:
+            self._on_content_changed(self)
+        self.content_changed.emit()
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Handle key press events.
@@ -52,60 +110,313 @@ class MessageTextEdit(QTextEdit):
             super().keyPressEvent(event)
 
     def focusOutEvent(self, event) -> None:
-        """Handle focus out to signal editing finished."""
+        """Handle focus out to flush pending changes and signal editing finished."""
         super().focusOutEvent(event)
+        if self._debounce.isActive():
+            self._debounce.stop()
+            self._notify_content_changed()
         self.editing_finished.emit()
 
 
-class MessageListItem(QWidget):
-    """A single message item in the list.
+class MessagesModel(QAbstractListModel):
+    """List model holding the raw message strings."""
 
-    Contains a multi-line text editor and delete button.
-    """
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._items: list[str] = []
+        self._editable = True
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of messages (flat list, no children)."""
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the message text for display and edit roles."""
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._items[index.row()]
+        return None
+
+    def setData(
+        self,
+        index: QModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Store edited message text."""
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        text = str(value)
+        if self._items[index.row()] == text:
+            return False
+        self._items[index.row()] = text
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Items are editable unless the model is locked."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if self._editable:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def insertRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        """Insert empty messages."""
+        if parent.isValid() or count <= 0 or not 0 <= row <= len(self._items):
+            return False
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        self._items[row:row] = [""] * count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        """Remove messages."""
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._items):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._items[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def append(self, content: str) -> int:
+        """Append a message and return its row."""
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(content)
+        self.endInsertRows()
+        return row
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        self.set_messages([])
 
-    content_changed = Signal()
-    delete_requested = Signal()
+    def set_messages(self, messages: list[str]) -> None:
+        """Replace all messages with a single model reset."""
+        self.beginResetModel()
+        self._items = list(messages)
+        self.endResetModel()
 
-    def __init__(self, content: str = "", parent: Optional[QWidget] = None) -> None:
-        super().__init__(parent)
+    def messages(self) -> list[str]:
+        """Get a copy of all raw messages."""
+        return list(self._items)
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(8)
+    def set_editable(self, editable: bool) -> None:
+        """Lock or unlock editing of all items."""
+        self._editable = editable
 
-        # Text editor
-        self._editor = MessageTextEdit()
-        self._editor.setPlainText(content)
-        self._editor.textChanged.connect(self._on_text_changed)
-        layout.addWidget(self._editor, 1)
 
-        # Delete button
-        self._delete_btn = QPushButton("×")
-        self._delete_btn.setFixedSize(24, 24)
-        self._delete_btn.setToolTip("删除此消息")
-        self._delete_btn.clicked.connect(self.delete_requested.emit)
-        layout.addWidget(self._delete_btn, 0, Qt.AlignmentFlag.AlignTop)
-
-    def _on_text_changed(self) -> None:
-        """Handle text changes."""
-        self.content_changed.emit()
+class MessageItemDelegate(QStyledItemDelegate):
+    """Paints message rows and provides the in-place editor.
 
-    def get_content(self) -> str:
-        """Get the message content."""
-        return self._editor.toPlainText()
+    Each row is a text area with a delete button on the right. Rows are
+    painted with QPainter only; a MessageTextEdit is created just for
+    the row being edited.
+    """
+
+    # Tooltip of the painted delete button
+    DELETE_TOOLTIP = "删除此消息"
 
-    def set_content(self, content: str) -> None:
-        """Set the message content."""
-        self._editor.setPlainText(content)
+    # Layout metrics (match the former per-row widget layout)
+    MARGIN = 4
+    SPACING = 8
+    BUTTON_SIZE = 24
+    TEXT_PADDING = 6
+    VISIBLE_LINES = 3
 
-    def is_empty(self) -> bool:
-        """Check if content is empty or whitespace only."""
-        return self.get_content().strip() == ""
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        *,
+        on_delete: Callable[[int], None],
+    ) -> None:
+        """Initialize the delegate.
+
+        Args:
+            parent: Parent object
+            on_delete: Called with the row whose delete button was clicked
+        """
+        super().__init__(parent)
+        self._on_delete = on_delete
+        self._editable = True
+        self._row_size: Optional[QSize] = None
 
     def set_editable(self, editable: bool) -> None:
-        """Enable or disable editing."""
-        self._editor.setReadOnly(not editable)
-        self._delete_btn.setEnabled(editable)
+        """Enable or disable editing and delete buttons."""
+        self._editable = editable
+
+    def _text_rect(self, rect: QRect) -> QRect:
+        """Area of a row used by the text editor."""
+        return rect.adjusted(
+            self.MARGIN,
+            self.MARGIN,
+            -(self.MARGIN + self.SPACING + self.BUTTON_SIZE),
+            -self.MARGIN,
+        )
+
+    def _delete_rect(self, rect: QRect) -> QRect:
+        """Area of a row used by the delete button."""
+        return QRect(
+            rect.right() - self.MARGIN - self.BUTTON_SIZE + 1,
+            rect.top() + self.MARGIN,
+            self.BUTTON_SIZE,
+            self.BUTTON_SIZE,
+        )
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> None:
+        """Paint a message row without instantiating widgets."""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        text_rect = self._text_rect(option.rect)
+
+        painter.save()
+
+        # Text area frame
+        frame = QStyleOptionFrame()
+        frame.rect = text_rect
+        frame.palette = option.palette
+        frame.state = option.state | QStyle.StateFlag.State_Sunken
+        frame.lineWidth = 1
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelLineEdit, frame, painter, widget)
+
+        # Text (or placeholder)
+        text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        inner = text_rect.adjusted(
+            self.TEXT_PADDING, self.TEXT_PADDING, -self.TEXT_PADDING, -self.TEXT_PADDING
+        )
+        painter.setClipRect(inner)
+        if text:
+            painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        else:
+            text = PLACEHOLDER_TEXT
+            painter.setPen(option.palette.color(QPalette.ColorRole.PlaceholderText))
+        painter.drawText(
+            inner,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            text,
+        )
+        painter.setClipping(False)
+
+        # Delete button
+        button = QStyleOptionButton()
+        button.rect = self._delete_rect(option.rect)
+        button.text = "×"
+        button.palette = option.palette
+        button.state = QStyle.StateFlag.State_Raised
+        if self._editable:
+            button.state |= QStyle.StateFlag.State_Enabled
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, widget)
+
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Fixed row size from font metrics, shared by all rows."""
+        if self._row_size is None:
+            text_height = (
+                self.VISIBLE_LINES * option.fontMetrics.lineSpacing() + 2 * self.TEXT_PADDING
+            )
+            editor_height = min(
+                max(text_height, MessageTextEdit.MIN_HEIGHT), MessageTextEdit.MAX_HEIGHT
+            )
+            self._row_size = QSize(100, editor_height + 2 * self.MARGIN)
+        return self._row_size
+
+    def createEditor(
+        self,
+        parent: QWidget,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> QWidget:
+        """Create the multi-line editor for the row being edited."""
+        # Push edits to the model once typing pauses
+        return MessageTextEdit(parent, on_content_changed=self._commit_editor)
+
+    def _commit_editor(self, editor: MessageTextEdit) -> None:
+        """Commit editor text unless the view already closed it."""
+        # A closed editor was hidden and committed by the view on focus out
+        if editor.isVisible():
+            self.commitData.emit(editor)
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        """Load the message text into the editor."""
+        text = index.data(Qt.ItemDataRole.EditRole) or ""
+        # Skip when unchanged so live commits don't reset the cursor
+        if editor.toPlainText() != text:  # type: ignore
+            # Don't commit back while the view is still registering the editor
+            editor.blockSignals(True)
+            editor.setPlainText(text)  # type: ignore
+            editor.blockSignals(False)
+
+    def setModelData(
+        self,
+        editor: QWidget,
+        model: QAbstractItemModel,
+        index: QModelIndex,
+    ) -> None:
+        """Store the editor text into the model."""
+        model.setData(index, editor.toPlainText(), Qt.ItemDataRole.EditRole)  # type: ignore
+
+    def updateEditorGeometry(
+        self,
+        editor: QWidget,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> None:
+        """Place the editor over the text area of the row."""
+        editor.setGeometry(self._text_rect(option.rect))
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> bool:
+        """Hit-test the painted delete button."""
+        if event.type() not in (
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.MouseButtonRelease,
+            QEvent.Type.MouseButtonDblClick,
+        ):
+            return super().editorEvent(event, model, option, index)
+
+        if not self._delete_rect(option.rect).contains(event.position().toPoint()):  # type: ignore
+            return super().editorEvent(event, model, option, index)
+
+        # Act on press: the view swallows the release when the press
+        # closed an open editor on the same row
+        if (
+            self._editable
+            and event.type() == QEvent.Type.MouseButtonPress
+            and event.button() == Qt.MouseButton.LeftButton  # type: ignore
+        ):
+            self._on_delete(index.row())
+        return True
+
+    def helpEvent(
+        self,
+        event: QHelpEvent,
+        view: QAbstractItemView,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> bool:
+        """Show the delete button's tooltip when hovering the painted button."""
+        if (
+            event.type() == QEvent.Type.ToolTip
+            and self._delete_rect(option.rect).contains(event.pos())
+        ):
+            QToolTip.showText(event.globalPos(), self.DELETE_TOOLTIP, view)
+            return True
+        return super().helpEvent(event, view, option, index)
 
 
 class MessageEditor(QWidget):
@@ -120,9 +431,25 @@ class MessageEditor(QWidget):
 
     messages_changed = Signal()
 
+    _EDIT_TRIGGERS = (
+        QAbstractItemView.EditTrigger.CurrentChanged |
+        QAbstractItemView.EditTrigger.SelectedClicked |
+        QAbstractItemView.EditTrigger.DoubleClicked |
+        QAbstractItemView.EditTrigger.EditKeyPressed |
+        QAbstractItemView.EditTrigger.AnyKeyPressed
+    )
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
+        # Cached filtered messages and their digest, None when stale
+        self._cached_messages: Optional[list[str]] = None
+        self._content_hash: Optional[bytes] = None
+        # Last valid message count shown in the count label
+        self._last_count = -1
+        # Whether the last item is known to be empty
+        self._has_trailing_empty = False
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -139,98 +466,114 @@ class MessageEditor(QWidget):
 
         toolbar.addStretch()
 
-        self._count_label = QPushButton("0 条消息")
-        self._count_label.setFlat(True)
-        self._count_label.setEnabled(False)
+        self._count_label = QLabel("0 条消息")
+        self._count_label.setAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
         toolbar.addWidget(self._count_label)
 
         layout.addLayout(toolbar)
 
         # Message list
-        self._list = QListWidget()
+        self._model = MessagesModel(self)
+        self._delegate = MessageItemDelegate(self, on_delete=self._delete_item)
+
+        self._list = QListView()
         self._list.setSpacing(4)
+        self._list.setModel(self._model)
+        self._list.setItemDelegate(self._delegate)
+        self._list.setEditTriggers(self._EDIT_TRIGGERS)
+        # All rows share one size, so layout only measures visible rows
+        self._list.setUniformItemSizes(True)
+        self._list.setLayoutMode(QListView.LayoutMode.Batched)
+        self._list.setBatchSize(32)
+        self._list.setResizeMode(QListView.ResizeMode.Adjust)
+        self._list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         layout.addWidget(self._list)
 
+        self._model.dataChanged.connect(self._on_item_changed)
+
         # Initialize with one empty item
         self._add_empty_item()
 
     def _add_empty_item(self) -> None:
         """Add an empty message item at the end."""
         self._add_item("")
+        self._has_trailing_empty = True
 
-    def _add_item(self, content: str) -> MessageListItem:
+    def _add_item(self, content: str) -> int:
         """Add a message item with given content.
 
         Args:
             content: Initial message content
 
         Returns:
-            The created MessageListItem
+            Row of the created item
         """
-        item_widget = MessageListItem(content)
-        item_widget.content_changed.connect(self._on_item_changed)
-        item_widget.delete_requested.connect(
-            lambda: self._delete_item(item_widget)
-        )
-
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(item_widget.sizeHint())
-        self._list.addItem(list_item)
-        self._list.setItemWidget(list_item, item_widget)
-
+        row = self._model.append(content)
+        self._invalidate_cache()
         self._update_count()
-        return item_widget
+        return row
 
-    def _delete_item(self, item_widget: MessageListItem) -> None:
-        """Delete a message item."""
-        for i in range(self._list.count()):
-            list_item = self._list.item(i)
-            if self._list.itemWidget(list_item) == item_widget:
-                self._list.takeItem(i)
-                break
+    def _delete_item(self, row: int) -> None:
+        """Delete the message item at the given row."""
+        # Rows come straight from the delegate's index, no lookup needed
+        if not self._model.removeRows(row, 1):
+            return
 
         # Ensure at least one empty item exists
-        if self._list.count() == 0:
+        if self._model.rowCount() == 0:
             self._add_empty_item()
+        else:
+            self._has_trailing_empty = self._is_last_empty()
 
+        self._invalidate_cache()
         self._update_count()
         self.messages_changed.emit()
 
     def _clear_all(self) -> None:
         """Clear all messages."""
-        self._list.clear()
+        self._model.clear()
+        self._invalidate_cache()
         self._add_empty_item()
         self.messages_changed.emit()
 
-    def _on_item_changed(self) -> None:
+    def _on_item_changed(self, top_left: QModelIndex) -> None:
         """Handle content change in any item.
 
         Auto-append empty item when last becomes non-empty (Spec 5.1).
         """
-        # Check if last item is non-empty
-        if self._list.count() > 0:
-            last_item = self._list.item(self._list.count() - 1)
-            last_widget = self._list.itemWidget(last_item)
-            if last_widget and not last_widget.is_empty():
-                self._add_empty_item()
+        self._invalidate_cache()
+
+        # Only an edit of the last item can fill the trailing empty one
+        if top_left.row() == self._model.rowCount() - 1:
+            self._has_trailing_empty = self._is_last_empty()
+        if not self._has_trailing_empty:
+            self._add_empty_item()
 
         self._update_count()
         self.messages_changed.emit()
 
+    def _is_last_empty(self) -> bool:
+        """Check if the last item is empty or whitespace only."""
+        count = self._model.rowCount()
+        if count == 0:
+            return False
+        last = self._model.data(self._model.index(count - 1))
+        # isspace() stops at the first visible char and allocates nothing
+        return not last or last.isspace()
+
     def _update_count(self) -> None:
         """Update the message count display."""
-        valid_count = len(self.get_messages())
+        valid_count = len(self._get_filtered_messages())
+        if valid_count == self._last_count:
+            return
+        self._last_count = valid_count
         self._count_label.setText(f"{valid_count} 条消息")
 
     def get_raw_messages(self) -> list[str]:
         """Get all messages including empty ones."""
-        messages = []
-        for i in range(self._list.count()):
-            list_item = self._list.item(i)
-            widget = self._list.itemWidget(list_item)
-            if widget:
-                messages.append(widget.get_content())
-        return messages
+        return self._model.messages()
 
     def get_messages(self) -> list[str]:
         """Get filtered messages (non-empty only).
@@ -238,7 +581,21 @@ class MessageEditor(QWidget):
         Implements the filter logic from Spec 5.1:
         messages = [m for m in messages_raw if trim(m) != ""]
         """
-        return [m.strip() for m in self.get_raw_messages() if m.strip()]
+        return list(self._get_filtered_messages())
+
+    def _get_filtered_messages(self) -> list[str]:
+        """Get the cached filtered messages, rebuilding after an edit."""
+        if self._cached_messages is None:
+            # Strip each message once and keep the result if non-empty
+            self._cached_messages = [
+                s for m in self._model.messages() if (s := m.strip())
+            ]
+        return self._cached_messages
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached messages and digest after the model changed."""
+        self._cached_messages = None
+        self._content_hash = None
 
     def set_messages(self, messages: list[str]) -> None:
         """Set messages from a list.
@@ -246,44 +603,60 @@ class MessageEditor(QWidget):
         Args:
             messages: List of message strings
         """
-        self._list.clear()
-        for msg in messages:
-            self._add_item(msg)
+        items = list(messages)
         # Ensure empty item at end
-        if self._list.count() == 0 or not self._get_last_widget().is_empty():
-            self._add_empty_item()
+        if not items or items[-1].strip():
+            items.append("")
+        # Load everything with a single model reset
+        self._model.set_messages(items)
+        self._has_trailing_empty = True
+        self._invalidate_cache()
         self._update_count()
 
-    def _get_last_widget(self) -> Optional[MessageListItem]:
-        """Get the last item's widget."""
-        if self._list.count() == 0:
-            return None
-        last_item = self._list.item(self._list.count() - 1)
-        return self._list.itemWidget(last_item)
-
     def set_editable(self, editable: bool) -> None:
         """Enable or disable editing of all items.
 
         Args:
             editable: Whether messages can be edited
         """
-        for i in range(self._list.count()):
-            list_item = self._list.item(i)
-            widget = self._list.itemWidget(list_item)
-            if widget:
-                widget.set_editable(editable)
+        if not editable:
+            # Changing the current index commits and closes an open editor
+            self._list.setCurrentIndex(QModelIndex())
+        self._model.set_editable(editable)
+        self._delegate.set_editable(editable)
+        self._list.setEditTriggers(
+            self._EDIT_TRIGGERS if editable
+            else QAbstractItemView.EditTrigger.NoEditTriggers
+        )
+        self._list.viewport().update()
 
         self._add_btn.setEnabled(editable)
         self._clear_btn.setEnabled(editable)
 
-    def get_snapshot(self) -> list[str]:
+    def _get_content_hash(self) -> bytes:
+        """Get the BLAKE2b digest of the filtered messages.
+
+        The digest is cached and only recomputed after an edit.
+        """
+        if self._content_hash is None:
+            h = hashlib.blake2b(digest_size=16)
+            for msg in self._get_filtered_messages():
+                data = msg.encode("utf-8")
+                # Length prefix keeps message boundaries unambiguous
+                h.update(len(data).to_bytes(8, "little"))
+                h.update(data)
+            self._content_hash = h.digest()
+        return self._content_hash
+
+    def get_snapshot(self) -> bytes:
         """Get a snapshot of current messages for change detection.
 
         Used for Pause/Resume message change detection (Spec 10.1).
+        The snapshot is a 16-byte content digest rather than a list copy.
         """
-        return self.get_messages().copy()
+        return self._get_content_hash()
 
-    def has_changed(self, snapshot: list[str]) -> bool:
+    def has_changed(self, snapshot: bytes) -> bool:
         """Check if messages have changed since snapshot.
 
         Args:
@@ -292,6 +665,4 @@ class MessageEditor(QWidget):
         Returns:
             True if messages have changed
         """
-        return self.get_messages() != snapshot
-
-
+        return self._get_content_hash() != snapshot
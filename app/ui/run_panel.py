@@ -8,9 +8,11 @@ The main control panel that shows during automation:
 See Executable Spec Section 3 for requirements.
 """
 
+import threading
 from typing import Optional
 
-from PySide6.QtCore import QPoint, Qt, Signal, Slot
+from PySide6.QtCore import QPoint, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QScreen
 from PySide6.QtWidgets import (
     QApplication,
     QButtonGroup,
@@ -40,7 +42,15 @@ from .widgets import (
 
 
 class LogView(QPlainTextEdit):
-    """Log viewer with circular buffer display."""
+    """Log viewer with circular buffer display.
+
+    Entries added with add_entry are queued and appended in one batch
+    per flush interval, so a burst of log records costs a single
+    document update. Callers that already batch use append_entries.
+    """
+
+    # Interval for flushing queued entries
+    FLUSH_INTERVAL_MS = 50
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -51,15 +61,43 @@ class LogView(QPlainTextEdit):
             "font-family: Consolas, Monaco, monospace; font-size: 11px;"
         )
 
+        # Pending formatted entries, flushed by a coalescing timer
+        self._pending: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
     def add_entry(self, entry: LogEntry) -> None:
-        """Add a log entry."""
-        self.appendPlainText(entry.format())
+        """Queue a log entry for the next flush."""
+        self._pending.append(entry.format())
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Append all queued entries at once."""
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        self.appendPlainText(text)
+
+    def append_entries(self, entries: list[LogEntry]) -> None:
+        """Append already-batched entries immediately."""
+        self._flush()
+        self.appendPlainText("\n".join(entry.format() for entry in entries))
 
     def set_entries(self, entries: list[LogEntry]) -> None:
         """Set all log entries."""
-        self.clear()
-        for entry in entries:
-            self.appendPlainText(entry.format())
+        self._flush_timer.stop()
+        self._pending.clear()
+        self.setPlainText("\n".join(entry.format() for entry in entries))
+
+    def clear(self) -> None:
+        """Clear the log, dropping entries not yet flushed."""
+        self._flush_timer.stop()
+        self._pending.clear()
+        super().clear()
 
 
 class RunPanel(QWidget):
@@ -82,6 +120,14 @@ class RunPanel(QWidget):
     calibrate_send_requested = Signal()
     threshold_calibrate_requested = Signal()
     threshold_changed = Signal(float)
+    # Wakes the GUI thread to drain entries posted from any thread
+    _log_entries_posted = Signal()
+
+    # Prebuilt calibration stylesheets
+    _STYLE_SET = "background-color: #d4edda;"
+    _STYLE_UNSET = ""
+    _STYLE_OK = "color: #28a745;"
+    _STYLE_ERR = "color: #dc3545;"
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -101,24 +147,43 @@ class RunPanel(QWidget):
         self._setup_ui()
         self._connect_signals()
 
+        # Entries posted by the log buffer listener, drained on the GUI
+        # thread; always queued, so entries logged on the GUI thread are
+        # batched too
+        self._posted_entries: list[LogEntry] = []
+        self._posted_lock = threading.Lock()
+        self._log_entries_posted.connect(
+            self._drain_posted_entries, Qt.ConnectionType.QueuedConnection
+        )
+
         # State tracking
         self._is_running = False
         self._send_point: Optional[Point] = None
+        # Last (roi_set, input_set, send_set) shown, None before first update
+        self._calib_flags: Optional[tuple[bool, bool, bool]] = None
+        # Last state applied, to skip no-op panel relayouts (progress and
+        # countdown widgets skip their own no-op updates)
+        self._last_state: Optional[State] = None
+        # Screen containing the send point, None until looked up
+        self._target_screen: Optional[QScreen] = None
+
+        # Screen layout changes may move the send point to another screen
+        app = QApplication.instance()
+        app.screenAdded.connect(self._invalidate_target_screen)  # type: ignore
+        app.screenRemoved.connect(self._invalidate_target_screen)  # type: ignore
+        app.primaryScreenChanged.connect(self._invalidate_target_screen)  # type: ignore
 
     def _setup_ui(self) -> None:
         """Setup the UI layout."""
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
+        self._layout = layout
 
-        # Warning banner (hidden by default)
-        self._warning_banner = FixedWarningBanner()
-        self._warning_banner.hide()
-        layout.addWidget(self._warning_banner)
-
-        # Countdown display (hidden by default)
-        self._countdown = CountdownDisplay()
-        self._countdown.hide()
-        layout.addWidget(self._countdown)
+        # Warning banner, countdown and run controls are only needed
+        # while running; they are created on first use
+        self._warning_banner: Optional[FixedWarningBanner] = None
+        self._countdown: Optional[CountdownDisplay] = None
+        self._controls: Optional[ControlButtons] = None
 
         # Status section
         status_frame = QFrame()
@@ -179,17 +244,18 @@ class RunPanel(QWidget):
 
         # Calibration status
         self._calib_status = QLabel("未完成标定")
-        self._calib_status.setStyleSheet("color: #dc3545;")
+        self._calib_status.setStyleSheet(self._STYLE_ERR)
         calib_layout.addWidget(self._calib_status)
 
         layout.addWidget(calib_frame)
 
         # Threshold section
         self._threshold_input = ThresholdInput()
+        # Chain widget signals straight to the panel's own signals
         self._threshold_input.calibrate_clicked.connect(
-            self.threshold_calibrate_requested.emit
+            self.threshold_calibrate_requested
         )
-        self._threshold_input.value_changed.connect(self.threshold_changed.emit)
+        self._threshold_input.value_changed.connect(self.threshold_changed)
         layout.addWidget(self._threshold_input)
 
         # Control buttons
@@ -202,13 +268,7 @@ class RunPanel(QWidget):
         self._start_btn.clicked.connect(self.start_requested.emit)
         control_layout.addWidget(self._start_btn)
 
-        self._controls = ControlButtons()
-        self._controls.pause_clicked.connect(self.pause_requested.emit)
-        self._controls.resume_clicked.connect(self.resume_requested.emit)
-        self._controls.stop_clicked.connect(self.stop_requested.emit)
-        self._controls.hide()
-        control_layout.addWidget(self._controls)
-
+        self._control_layout = control_layout
         layout.addLayout(control_layout)
 
         # Log section
@@ -219,6 +279,34 @@ class RunPanel(QWidget):
         self._log_view = LogView()
         layout.addWidget(self._log_view, 1)
 
+    def _ensure_warning_banner(self) -> FixedWarningBanner:
+        """Create the warning banner at the top of the panel on first use."""
+        if self._warning_banner is None:
+            self._warning_banner = FixedWarningBanner()
+            self._warning_banner.hide()
+            self._layout.insertWidget(0, self._warning_banner)
+        return self._warning_banner
+
+    def _ensure_countdown(self) -> CountdownDisplay:
+        """Create the countdown display below the warning banner on first use."""
+        if self._countdown is None:
+            self._countdown = CountdownDisplay()
+            self._countdown.hide()
+            index = 0 if self._warning_banner is None else 1
+            self._layout.insertWidget(index, self._countdown)
+        return self._countdown
+
+    def _ensure_controls(self) -> ControlButtons:
+        """Create the pause/resume/stop buttons next to Start on first use."""
+        if self._controls is None:
+            self._controls = ControlButtons()
+            self._controls.pause_clicked.connect(self.pause_requested)
+            self._controls.resume_clicked.connect(self.resume_requested)
+            self._controls.stop_clicked.connect(self.stop_requested)
+            self._controls.hide()
+            self._control_layout.addWidget(self._controls)
+        return self._controls
+
     def _connect_signals(self) -> None:
         """Connect internal signals."""
         pass
@@ -240,6 +328,10 @@ class RunPanel(QWidget):
         Args:
             state: Current automation state
         """
+        if state is self._last_state:
+            return
+        self._last_state = state
+
         self._status.set_state(state.name)
 
         # Update UI based on state
@@ -250,11 +342,21 @@ class RunPanel(QWidget):
         self._is_running = is_running
 
         # Show/hide elements
-        self._warning_banner.setVisible(is_running)
-        self._countdown.setVisible(is_countdown)
+        if is_running:
+            self._ensure_warning_banner().show()
+            controls = self._ensure_controls()
+            controls.show()
+            controls.set_paused(is_paused)
+        else:
+            if self._warning_banner is not None:
+                self._warning_banner.hide()
+            if self._controls is not None:
+                self._controls.hide()
+        if is_countdown:
+            self._ensure_countdown().show()
+        elif self._countdown is not None:
+            self._countdown.hide()
         self._start_btn.setVisible(not is_running)
-        self._controls.setVisible(is_running)
-        self._controls.set_paused(is_paused)
 
         # Enable/disable calibration buttons
         self._set_calibration_enabled(not is_running)
@@ -277,7 +379,7 @@ class RunPanel(QWidget):
         Args:
             seconds: Remaining seconds
         """
-        self._countdown.set_value(seconds)
+        self._ensure_countdown().set_value(seconds)
 
     def set_calibration_status(
         self,
@@ -292,11 +394,17 @@ class RunPanel(QWidget):
             input_set: Whether input point is set
             send_set: Whether send point is set
         """
+        flags = (roi_set, input_set, send_set)
+        previous = self._calib_flags
+        if flags == previous:
+            return
+        self._calib_flags = flags
+
         all_set = roi_set and input_set and send_set
 
         if all_set:
             self._calib_status.setText("✓ 标定完成")
-            self._calib_status.setStyleSheet("color: #28a745;")
+            self._calib_status.setStyleSheet(self._STYLE_OK)
             self._start_btn.setEnabled(True)
         else:
             missing = []
@@ -307,19 +415,14 @@ class RunPanel(QWidget):
             if not send_set:
                 missing.append("发送点")
             self._calib_status.setText(f"未设置: {', '.join(missing)}")
-            self._calib_status.setStyleSheet("color: #dc3545;")
+            self._calib_status.setStyleSheet(self._STYLE_ERR)
             self._start_btn.setEnabled(False)
 
-        # Update button styles
-        self._roi_btn.setStyleSheet(
-            "background-color: #d4edda;" if roi_set else ""
-        )
-        self._input_btn.setStyleSheet(
-            "background-color: #d4edda;" if input_set else ""
-        )
-        self._send_btn.setStyleSheet(
-            "background-color: #d4edda;" if send_set else ""
-        )
+        # Restyle only the buttons whose flag flipped
+        buttons = (self._roi_btn, self._input_btn, self._send_btn)
+        for i, (button, is_set) in enumerate(zip(buttons, flags)):
+            if previous is None or previous[i] != is_set:
+                button.setStyleSheet(self._STYLE_SET if is_set else self._STYLE_UNSET)
 
     def _set_calibration_enabled(self, enabled: bool) -> None:
         """Enable or disable calibration buttons and shape selection."""
@@ -354,6 +457,12 @@ class RunPanel(QWidget):
             point: Send button location
         """
         self._send_point = point
+        self._target_screen = None
+
+    @Slot()
+    def _invalidate_target_screen(self) -> None:
+        """Forget the cached target screen after a screen layout change."""
+        self._target_screen = None
 
     def snap_to_screen_corner(self) -> None:
         """Snap panel to bottom-right of screen containing send point.
@@ -363,16 +472,15 @@ class RunPanel(QWidget):
         if self._send_point is None:
             return
 
-        # Find screen containing send point
-        target_screen = None
-        for screen in QApplication.screens():
-            geom = screen.geometry()
-            if geom.contains(self._send_point.x, self._send_point.y):
-                target_screen = screen
-                break
-
+        # Find screen containing send point (cached until invalidated)
+        target_screen = self._target_screen
         if target_screen is None:
-            target_screen = QApplication.primaryScreen()
+            target_screen = QApplication.screenAt(
+                QPoint(self._send_point.x, self._send_point.y)
+            )
+            if target_screen is None:
+                target_screen = QApplication.primaryScreen()
+            self._target_screen = target_screen
 
         # Calculate position
         available = target_screen.availableGeometry()
@@ -391,6 +499,28 @@ class RunPanel(QWidget):
         """
         self._log_view.add_entry(entry)
 
+    def _post_log_entry(self, entry: LogEntry) -> None:
+        """Log buffer listener, safe to call from any thread.
+
+        Queues the entry for the GUI thread instead of touching the log
+        view from the producer's thread. Only the first entry of a batch
+        posts a wakeup; the rest ride along until it is drained.
+        """
+        with self._posted_lock:
+            self._posted_entries.append(entry)
+            wake = len(self._posted_entries) == 1
+        if wake:
+            self._log_entries_posted.emit()
+
+    @Slot()
+    def _drain_posted_entries(self) -> None:
+        """Append all entries posted since the last drain, on the GUI thread."""
+        with self._posted_lock:
+            entries = self._posted_entries
+            self._posted_entries = []
+        if entries:
+            self._log_view.append_entries(entries)
+
     def set_log_buffer(self, buffer: LogBuffer) -> None:
         """Set log buffer and display existing entries.
 
@@ -400,11 +530,13 @@ class RunPanel(QWidget):
         # Display existing entries
         self._log_view.set_entries(buffer.get_all())
 
-        # Add listener for new entries
-        buffer.add_listener(self.add_log_entry)
+        # Add listener for new entries (may fire from worker threads)
+        buffer.add_listener(self._post_log_entry)
 
     def clear_log(self) -> None:
         """Clear the log view."""
+        with self._posted_lock:
+            self._posted_entries = []
         self._log_view.clear()
 
     # Window behavior
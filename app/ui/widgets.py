@@ -3,11 +3,13 @@
 Provides reusable UI components used across the application.
 """
 
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import (
+    QDoubleSpinBox,
     QFrame,
     QHBoxLayout,
     QLabel,
@@ -16,6 +18,31 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from app.core.progress import progress_labels
+
+# Yellow warning colors shared by all banners; unset roles resolve
+# against the widget's default palette
+_WARN_PALETTE = QPalette()
+_WARN_PALETTE.setColor(QPalette.ColorRole.Window, QColor(255, 243, 205))
+_WARN_PALETTE.setColor(QPalette.ColorRole.WindowText, QColor(133, 100, 4))
+
+
+@contextmanager
+def _batched_update(widget: QWidget) -> Iterator[None]:
+    """Suspend repaints of a widget while several children change.
+
+    Schedules a single update() for the whole widget on exit.
+
+    Args:
+        widget: Widget whose subtree is being modified
+    """
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
 
 class WarningBanner(QFrame):
     """A dismissible warning banner with yellow background.
@@ -44,10 +71,7 @@ class WarningBanner(QFrame):
         self.setFrameStyle(QFrame.Shape.StyledPanel)
 
         # Yellow background
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(255, 243, 205))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(133, 100, 4))
-        self.setPalette(palette)
+        self.setPalette(_WARN_PALETTE)
 
         # Layout
         layout = QHBoxLayout(self)
@@ -66,6 +90,7 @@ class WarningBanner(QFrame):
             close_btn.clicked.connect(self._on_dismiss)
             layout.addWidget(close_btn)
 
+    @Slot()
     def _on_dismiss(self) -> None:
         """Handle dismiss button click."""
         self.hide()
@@ -89,10 +114,7 @@ class FixedWarningBanner(QFrame):
         self.setFrameStyle(QFrame.Shape.StyledPanel)
 
         # Yellow background
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(255, 243, 205))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(133, 100, 4))
-        self.setPalette(palette)
+        self.setPalette(_WARN_PALETTE)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 6, 12, 6)
@@ -105,19 +127,22 @@ class FixedWarningBanner(QFrame):
 class StatusIndicator(QWidget):
     """Status indicator showing current automation state."""
 
-    # State to color mapping
-    STATE_COLORS = {
-        "Idle": QColor(128, 128, 128),       # Gray
-        "Countdown": QColor(255, 193, 7),     # Yellow
-        "Sending": QColor(0, 123, 255),       # Blue
-        "Cooling": QColor(23, 162, 184),      # Cyan
-        "WaitingHold": QColor(40, 167, 69),   # Green
-        "Paused": QColor(255, 152, 0),        # Orange
+    # State to dot stylesheet mapping
+    STATE_STYLESHEETS = {
+        "Idle": "color: #808080;",          # Gray
+        "Countdown": "color: #ffc107;",     # Yellow
+        "Sending": "color: #007bff;",       # Blue
+        "Cooling": "color: #17a2b8;",       # Cyan
+        "WaitingHold": "color: #28a745;",   # Green
+        "Paused": "color: #ff9800;",        # Orange
     }
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
+        # Last dot stylesheet shown, None before the first update
+        self._last_sheet: Optional[str] = None
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
@@ -139,24 +164,53 @@ class StatusIndicator(QWidget):
         Args:
             state: State name (Idle, Countdown, Sending, etc.)
         """
-        self._text.setText(state)
-        color = self.STATE_COLORS.get(state, QColor(128, 128, 128))
-        self._dot.setStyleSheet(f"color: {color.name()};")
+        # RunPanel.set_state already skips repeated states
+        sheet = self.STATE_STYLESHEETS.get(state, self.STATE_STYLESHEETS["Idle"])
+        with _batched_update(self):
+            self._text.setText(state)
+            if sheet != self._last_sheet:
+                self._last_sheet = sheet
+                self._dot.setStyleSheet(sheet)
 
 
 class ProgressDisplay(QWidget):
     """Progress display showing i/N format."""
 
+    _LABEL_STYLE = "font-size: 18px; font-weight: bold;"
+
+    # Largest total whose "i/N" texts are precomputed
+    MAX_TABLE_TOTAL = 1024
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
+        # Last (current, total) shown
+        self._last_progress = (0, 0)
+        # "i/N" texts for i in 0..N of the current total, empty if too large
+        self._total = 0
+        self._texts: tuple[str, ...] = ("0/0",)
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
         self._label = QLabel("0/0")
-        self._label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self._label.setStyleSheet(self._LABEL_STYLE)
         layout.addWidget(self._label)
 
+    def set_total(self, total: int) -> None:
+        """Set the total message count and precompute its progress texts.
+
+        Args:
+            total: Total message count
+        """
+        if total == self._total:
+            return
+        self._total = total
+        if 0 <= total <= self.MAX_TABLE_TOTAL:
+            self._texts = (f"0/{total}", *progress_labels(total))
+        else:
+            self._texts = ()
+
     def set_progress(self, current: int, total: int) -> None:
         """Update progress display.
 
@@ -164,28 +218,40 @@ class ProgressDisplay(QWidget):
             current: Current message index (1-based)
             total: Total message count
         """
-        self._label.setText(f"{current}/{total}")
+        progress = (current, total)
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self.set_total(total)
+        if 0 <= current < len(self._texts):
+            self._label.setText(self._texts[current])
+        else:
+            self._label.setText(f"{current}/{total}")
 
 
 class CountdownDisplay(QWidget):
     """Countdown timer display."""
 
+    _LABEL_STYLE = "font-size: 48px; font-weight: bold; color: #ffc107;"
+    _HINT_STYLE = "color: #666;"
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
+        # Last value shown, in tenths of a second (-1 forces first update)
+        self._last_displayed_tenths = -1
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self._label = QLabel("0.0")
-        self._label.setStyleSheet(
-            "font-size: 48px; font-weight: bold; color: #ffc107;"
-        )
+        self._label.setStyleSheet(self._LABEL_STYLE)
         self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._label)
 
         self._hint = QLabel("即将开始...")
-        self._hint.setStyleSheet("color: #666;")
+        self._hint.setStyleSheet(self._HINT_STYLE)
         self._hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._hint)
 
@@ -195,7 +261,12 @@ class CountdownDisplay(QWidget):
         Args:
             seconds: Remaining seconds
         """
-        self._label.setText(f"{seconds:.1f}")
+        # The label shows tenths; finer-grained ticks are dropped
+        tenths = round(seconds * 10)
+        if tenths == self._last_displayed_tenths:
+            return
+        self._last_displayed_tenths = tenths
+        self._label.setText(f"{tenths / 10:.1f}")
 
     def show_countdown(self) -> None:
         """Show countdown UI."""
@@ -216,35 +287,64 @@ class ControlButtons(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
+        self._enabled = True
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
+        self._layout = layout
 
         # Pause button
         self._pause_btn = QPushButton("暂停")
-        self._pause_btn.clicked.connect(self.pause_clicked.emit)
+        self._pause_btn.clicked.connect(self._emit_pause)
         layout.addWidget(self._pause_btn)
 
-        # Resume button (hidden by default)
-        self._resume_btn = QPushButton("继续")
-        self._resume_btn.clicked.connect(self.resume_clicked.emit)
-        self._resume_btn.hide()
-        layout.addWidget(self._resume_btn)
+        # Resume button, created on first pause
+        self._resume_btn: Optional[QPushButton] = None
 
         # Stop button
         self._stop_btn = QPushButton("停止")
         self._stop_btn.setStyleSheet("background-color: #dc3545; color: white;")
-        self._stop_btn.clicked.connect(self.stop_clicked.emit)
+        self._stop_btn.clicked.connect(self._emit_stop)
         layout.addWidget(self._stop_btn)
 
+    @Slot()
+    def _emit_pause(self) -> None:
+        """Forward pause button click."""
+        self.pause_clicked.emit()
+
+    @Slot()
+    def _emit_resume(self) -> None:
+        """Forward resume button click."""
+        self.resume_clicked.emit()
+
+    @Slot()
+    def _emit_stop(self) -> None:
+        """Forward stop button click."""
+        self.stop_clicked.emit()
+
+    def _ensure_resume_btn(self) -> QPushButton:
+        """Create the resume button next to the pause button on first use."""
+        if self._resume_btn is None:
+            self._resume_btn = QPushButton("继续")
+            self._resume_btn.clicked.connect(self._emit_resume)
+            self._resume_btn.setEnabled(self._enabled)
+            self._resume_btn.hide()
+            self._layout.insertWidget(1, self._resume_btn)
+        return self._resume_btn
+
     def set_paused(self, paused: bool) -> None:
         """Update button visibility based on paused state.
 
         Args:
             paused: Whether currently paused
         """
-        self._pause_btn.setVisible(not paused)
-        self._resume_btn.setVisible(paused)
+        with _batched_update(self):
+            self._pause_btn.setVisible(not paused)
+            if paused:
+                self._ensure_resume_btn().show()
+            elif self._resume_btn is not None:
+                self._resume_btn.hide()
 
     def set_enabled(self, enabled: bool) -> None:
         """Enable or disable all control buttons.
@@ -252,8 +352,10 @@ class ControlButtons(QWidget):
         Args:
             enabled: Whether buttons should be enabled
         """
+        self._enabled = enabled
         self._pause_btn.setEnabled(enabled)
-        self._resume_btn.setEnabled(enabled)
+        if self._resume_btn is not None:
+            self._resume_btn.setEnabled(enabled)
         self._stop_btn.setEnabled(enabled)
 
 
@@ -263,11 +365,13 @@ class ThresholdInput(QWidget):
     calibrate_clicked = Signal()
     value_changed = Signal(float)
 
+    # Calibrate button stylesheets
+    _HIGHLIGHT_ON = "background-color: #ffc107; font-weight: bold;"
+    _HIGHLIGHT_OFF = ""
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
-        from PySide6.QtWidgets import QDoubleSpinBox
-
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
@@ -281,14 +385,24 @@ class ThresholdInput(QWidget):
         self._spinbox.setDecimals(3)
         self._spinbox.setSingleStep(0.005)
         self._spinbox.setValue(0.02)
-        self._spinbox.valueChanged.connect(self.value_changed.emit)
+        self._spinbox.valueChanged[float].connect(self._on_value_changed)
         layout.addWidget(self._spinbox)
 
         # Calibrate button
         self._calibrate_btn = QPushButton("校准")
-        self._calibrate_btn.clicked.connect(self.calibrate_clicked.emit)
+        self._calibrate_btn.clicked.connect(self._emit_calibrate)
         layout.addWidget(self._calibrate_btn)
 
+    @Slot(float)
+    def _on_value_changed(self, value: float) -> None:
+        """Forward spin box value change."""
+        self.value_changed.emit(value)
+
+    @Slot()
+    def _emit_calibrate(self) -> None:
+        """Forward calibrate button click."""
+        self.calibrate_clicked.emit()
+
     def get_value(self) -> float:
         """Get current threshold value."""
         return self._spinbox.value()
@@ -304,11 +418,8 @@ class ThresholdInput(QWidget):
 
     def highlight_calibrate(self, highlight: bool) -> None:
         """Highlight calibrate button to suggest calibration."""
-        if highlight:
-            self._calibrate_btn.setStyleSheet(
-                "background-color: #ffc107; font-weight: bold;"
-            )
-        else:
-            self._calibrate_btn.setStyleSheet("")
+        self._calibrate_btn.setStyleSheet(
+            self._HIGHLIGHT_ON if highlight else self._HIGHLIGHT_OFF
+        )
 
 
@@ -12,7 +12,7 @@ import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 
-from app.core.diff import clamp, calibrate_threshold
+from app.core.diff import _mu_sigma_th, clamp, calibrate_threshold
 from app.core.model import ROI, Rect, ROIShape, CalibrationStats
 from app.core.constants import TH_HOLD_MIN, TH_HOLD_MAX
 
@@ -40,6 +40,10 @@ class TestClampFunction:
         assert clamp(0.005, 0.005, 0.2) == 0.005
         assert clamp(0.2, 0.005, 0.2) == 0.2
 
+    def test_nan_clamped_to_max(self) -> None:
+        """NaN input should clamp to max, never pass through."""
+        assert clamp(float("nan"), 0.005, 0.2) == 0.2
+
 
 class TestThresholdCalculation:
     """Test the core threshold calculation logic: mu + 3*sigma, clamped."""
@@ -88,6 +92,20 @@ class TestThresholdCalculation:
         th_rec = clamp(mu + 3 * sigma, TH_HOLD_MIN, TH_HOLD_MAX)
         assert TH_HOLD_MIN <= th_rec <= TH_HOLD_MAX
 
+    def test_mu_sigma_th_matches_numpy(self) -> None:
+        """Statistics helper should agree with np.mean/np.std."""
+        di_values = [0.015, 0.018, 0.012, 0.016, 0.014, 0.017, 0.013]
+        mu, sigma, th_rec = _mu_sigma_th(di_values, TH_HOLD_MIN, TH_HOLD_MAX)
+        assert mu == pytest.approx(np.mean(di_values))
+        assert sigma == pytest.approx(np.std(di_values))
+        assert th_rec == pytest.approx(
+            clamp(np.mean(di_values) + 3 * np.std(di_values), TH_HOLD_MIN, TH_HOLD_MAX)
+        )
+
+    def test_mu_sigma_th_empty_input(self) -> None:
+        """No diff values should give zero statistics and TH_MIN."""
+        assert _mu_sigma_th([], TH_HOLD_MIN, TH_HOLD_MAX) == (0.0, 0.0, TH_HOLD_MIN)
+
 
 class TestCalibrationStatsOutput:
     """Test CalibrationStats data structure."""
@@ -128,15 +146,11 @@ class TestCalibrateThresholdWithMock:
         self, mock_capture: MagicMock
     ) -> None:
         """Calibration should capture K frames."""
-        # Create mock frames that return static noise
-        def make_frame(noise_level: int) -> np.ndarray:
-            base = np.full((50, 50), 100, dtype=np.int16)
-            noise = np.random.randint(-noise_level, noise_level + 1, (50, 50), dtype=np.int16)
-            frame = base + noise
-            return np.clip(frame, 0, 255).astype(np.uint8)
-
-        np.random.seed(42)
-        mock_capture.side_effect = [make_frame(5) for _ in range(8)]
+        # Create mock frames that return static noise, all in one batch
+        rng = np.random.default_rng(42)
+        noise = rng.integers(-5, 6, (8, 50, 50), dtype=np.int16)
+        frames = np.clip(noise + 100, 0, 255).astype(np.uint8)
+        mock_capture.side_effect = list(frames)
 
         roi = ROI(
             shape=ROIShape.RECT,
@@ -160,6 +160,31 @@ class TestCircleContainsPoint:
         assert circle.contains_point(81.0, 50.0) is False  # Just outside right edge
 
 
+class TestCircleMask:
+    """Test Circle.mask() vectorized containment."""
+
+    def test_mask_matches_contains_point(self) -> None:
+        """Mask should agree with contains_point for every pixel."""
+        circle = Circle(cx=12.5, cy=8.0, r=6.0)
+        x0, y0 = 3, -2
+        mask = circle.mask(20, 25, x0, y0)
+
+        assert mask.shape == (20, 25)
+        for row in range(20):
+            for col in range(25):
+                assert mask[row, col] == circle.contains_point(x0 + col, y0 + row)
+
+    def test_mask_of_inscribed_circle(self) -> None:
+        """Mask of a rect's inscribed circle should stay inside the rect."""
+        rect = Rect(x=-40, y=10, w=60, h=30)
+        circle = Circle.from_rect(rect)
+        mask = circle.mask(rect.h, rect.w, rect.x, rect.y)
+
+        assert mask[rect.h // 2, rect.w // 2]
+        assert not mask[0, 0]
+        assert not mask[-1, -1]
+
+
 class TestInscribedCircleFormula:
     """Verify the inscribed circle formula from the spec."""
 
@@ -8,6 +8,7 @@ Verifies that:
 See Executable Spec Section 4.4 for requirements.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -20,9 +21,12 @@ from app.core.model import (
     VirtualDesktopInfo,
 )
 from app.core.os_adapter.validation import (
+    ValidationErrorCode,
     ValidationResult,
     validate_point_in_bounds,
+    validate_points_batch,
     validate_rect_in_bounds,
+    validate_rects_batch,
     validate_roi,
     validate_calibration_config,
 )
@@ -54,6 +58,25 @@ def valid_config(standard_desktop: VirtualDesktopInfo) -> CalibrationConfig:
     )
 
 
+class TestVirtualDesktopInfo:
+    """Test derived bounds on VirtualDesktopInfo."""
+
+    def test_bounds_tuple(
+        self, multi_monitor_desktop: VirtualDesktopInfo
+    ) -> None:
+        """bounds should be (left, top, right, bottom)."""
+        assert multi_monitor_desktop.bounds == (-1920, 0, 1920, 1080)
+        assert multi_monitor_desktop.right == 1920
+        assert multi_monitor_desktop.bottom == 1080
+
+    def test_is_immutable(
+        self, standard_desktop: VirtualDesktopInfo
+    ) -> None:
+        """Desktop info is frozen so cached edges cannot go stale."""
+        with pytest.raises(AttributeError):
+            standard_desktop.width = 100  # type: ignore
+
+
 class TestValidationResult:
     """Test ValidationResult helper class."""
 
@@ -61,7 +84,7 @@ class TestValidationResult:
         """Success result should be valid with no errors."""
         result = ValidationResult.success()
         assert result.valid is True
-        assert result.errors == []
+        assert result.errors == ()
         assert bool(result) is True
 
     def test_failure_is_invalid(self) -> None:
@@ -76,6 +99,21 @@ class TestValidationResult:
         result = ValidationResult.failure("Error 1", "Error 2", "Error 3")
         assert len(result.errors) == 3
 
+    def test_failure_carries_codes(self) -> None:
+        """Failure codes should be kept alongside the messages."""
+        result = ValidationResult.failure(
+            "Error", codes=(ValidationErrorCode.RECT_OUT_OF_BOUNDS,)
+        )
+        assert result.codes == (ValidationErrorCode.RECT_OUT_OF_BOUNDS,)
+        assert ValidationResult.success().codes == ()
+
+    def test_success_is_shared_and_immutable(self) -> None:
+        """Success results are one frozen instance."""
+        result = ValidationResult.success()
+        assert result is ValidationResult.success()
+        with pytest.raises(AttributeError):
+            result.valid = False  # type: ignore
+
 
 class TestPointValidation:
     """Test point coordinate validation."""
@@ -148,6 +186,40 @@ class TestPointValidation:
         assert result.valid is False
 
 
+class TestPointsBatchValidation:
+    """Test batched point validation."""
+
+    def test_batch_matches_single_point_checks(
+        self, multi_monitor_desktop: VirtualDesktopInfo
+    ) -> None:
+        """Batch result should agree with validate_point_in_bounds."""
+        points = [
+            Point(x=-1920, y=0),
+            Point(x=1919, y=1079),
+            Point(x=1920, y=500),
+            Point(x=-1921, y=500),
+            Point(x=0, y=1080),
+            Point(x=-500, y=-1),
+        ]
+        inside = validate_points_batch(
+            [(p.x, p.y) for p in points], multi_monitor_desktop
+        )
+        expected = [
+            validate_point_in_bounds(p, "测试点", multi_monitor_desktop).valid
+            for p in points
+        ]
+        assert inside.tolist() == expected
+
+    def test_batch_accepts_ndarray(
+        self, standard_desktop: VirtualDesktopInfo
+    ) -> None:
+        """An (N, 2) array should be accepted and give an (N,) mask."""
+        points = np.array([[0, 0], [5000, 0]], dtype=np.int32)
+        inside = validate_points_batch(points, standard_desktop)
+        assert inside.shape == (2,)
+        assert inside.tolist() == [True, False]
+
+
 class TestRectValidation:
     """Test rectangle coordinate validation."""
 
@@ -174,6 +246,7 @@ class TestRectValidation:
         rect = Rect(x=1800, y=100, w=200, h=100)  # Extends to 2000
         result = validate_rect_in_bounds(rect, "ROI", standard_desktop)
         assert result.valid is False
+        assert result.codes == (ValidationErrorCode.RECT_OUT_OF_BOUNDS,)
 
     def test_rect_extending_past_bottom_invalid(
         self, standard_desktop: VirtualDesktopInfo
@@ -192,6 +265,39 @@ class TestRectValidation:
         assert result.valid is False
 
 
+class TestRectsBatchValidation:
+    """Test batched rectangle validation."""
+
+    def test_batch_matches_single_rect_checks(
+        self, multi_monitor_desktop: VirtualDesktopInfo
+    ) -> None:
+        """Batch result should agree with validate_rect_in_bounds."""
+        rects = [
+            Rect(x=-1920, y=0, w=3840, h=1080),  # Full desktop
+            Rect(x=-100, y=100, w=200, h=200),   # Spans monitors
+            Rect(x=1800, y=100, w=200, h=100),   # Past right edge
+            Rect(x=-1921, y=0, w=10, h=10),      # Past left edge
+            Rect(x=0, y=-1, w=10, h=10),         # Past top edge
+            Rect(x=0, y=1000, w=10, h=81),       # Past bottom edge
+        ]
+        inside = validate_rects_batch(
+            [(r.x, r.y, r.w, r.h) for r in rects], multi_monitor_desktop
+        )
+        expected = [
+            validate_rect_in_bounds(r, "ROI", multi_monitor_desktop).valid
+            for r in rects
+        ]
+        assert inside.tolist() == expected
+
+    def test_batch_accepts_ndarray(
+        self, standard_desktop: VirtualDesktopInfo
+    ) -> None:
+        """An (N, 4) array should be accepted and give an (N,) mask."""
+        rects = np.array([[0, 0, 1920, 1080], [1, 0, 1920, 1080]], dtype=np.int32)
+        inside = validate_rects_batch(rects, standard_desktop)
+        assert inside.tolist() == [True, False]
+
+
 class TestROIValidation:
     """Test ROI-specific validation."""
 
@@ -210,7 +316,7 @@ class TestROIValidation:
         roi = ROI(shape=ROIShape.RECT, rect=Rect(x=100, y=100, w=0, h=200))
         result = validate_roi(roi, standard_desktop)
         assert result.valid is False
-        assert any("宽度" in err for err in result.errors)
+        assert ValidationErrorCode.ROI_WIDTH_NON_POSITIVE in result.codes
 
     def test_zero_height_roi_invalid(
         self, standard_desktop: VirtualDesktopInfo
@@ -219,7 +325,7 @@ class TestROIValidation:
         roi = ROI(shape=ROIShape.RECT, rect=Rect(x=100, y=100, w=200, h=0))
         result = validate_roi(roi, standard_desktop)
         assert result.valid is False
-        assert any("高度" in err for err in result.errors)
+        assert ValidationErrorCode.ROI_HEIGHT_NON_POSITIVE in result.codes
 
     def test_negative_dimensions_roi_invalid(
         self, standard_desktop: VirtualDesktopInfo
@@ -262,7 +368,7 @@ class TestCalibrationConfigValidation:
         )
         result = validate_calibration_config(config, standard_desktop)
         assert result.valid is False
-        assert any("输入点" in err for err in result.errors)
+        assert result.codes == (ValidationErrorCode.INPUT_POINT_OUT_OF_BOUNDS,)
 
     def test_invalid_send_point_fails(
         self, standard_desktop: VirtualDesktopInfo
@@ -276,7 +382,7 @@ class TestCalibrationConfigValidation:
         )
         result = validate_calibration_config(config, standard_desktop)
         assert result.valid is False
-        assert any("发送点" in err for err in result.errors)
+        assert result.codes == (ValidationErrorCode.SEND_POINT_OUT_OF_BOUNDS,)
 
     def test_invalid_roi_fails(
         self, standard_desktop: VirtualDesktopInfo
@@ -303,8 +409,40 @@ class TestCalibrationConfigValidation:
         )
         result = validate_calibration_config(config, standard_desktop)
         assert result.valid is False
-        # Should have multiple errors
+        # Should have multiple errors, each with a code
         assert len(result.errors) >= 2
+        assert result.codes == (
+            ValidationErrorCode.ROI_WIDTH_NON_POSITIVE,
+            ValidationErrorCode.ROI_HEIGHT_NON_POSITIVE,
+            ValidationErrorCode.INPUT_POINT_OUT_OF_BOUNDS,
+            ValidationErrorCode.SEND_POINT_OUT_OF_BOUNDS,
+        )
+
+    def test_validate_memoized(
+        self,
+        valid_config: CalibrationConfig,
+        standard_desktop: VirtualDesktopInfo,
+    ) -> None:
+        """Repeat calls with an equal config should not re-run the checks."""
+        from app.core.os_adapter import validation
+
+        validation._validate_calibration_config_cached.cache_clear()
+        with patch.object(
+            validation, "validate_roi", wraps=validation.validate_roi
+        ) as roi_check:
+            first = validate_calibration_config(valid_config, standard_desktop)
+            second = validate_calibration_config(
+                CalibrationConfig(
+                    roi=valid_config.roi,
+                    input_point=valid_config.input_point,
+                    send_point=valid_config.send_point,
+                    th_hold=valid_config.th_hold,
+                ),
+                standard_desktop,
+            )
+
+        assert roi_check.call_count == 1
+        assert first.valid and second.valid
 
 
 class TestStartPrevention:
@@ -11,7 +11,14 @@ See Executable Spec Section 7.1 for requirements.
 import numpy as np
 import pytest
 
-from app.core.diff import calculate_diff
+from app.core.diff import (
+    _absdiff_scratch,
+    _absdiff_u8,
+    _sad_u8,
+    calculate_diff,
+    calculate_diff_batch,
+    create_circle_mask,
+)
 from app.core.capture import to_grayscale
 from app.core.model import ROI, Rect, ROIShape
 
@@ -25,6 +32,25 @@ class TestDiffCalculation:
         diff = calculate_diff(frame, frame)
         assert diff == 0.0
 
+    def test_same_buffer_detected_fast(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Frames sharing one buffer should return 0 without diffing pixels."""
+        import app.core.diff as diff_module
+
+        def fail(*args: object) -> None:
+            raise AssertionError("absdiff kernel should not run")
+
+        monkeypatch.setattr(diff_module, "_absdiff_u8", fail)
+        frame = np.random.randint(0, 256, (50, 50), dtype=np.uint8)
+
+        assert calculate_diff(frame, frame) == 0.0
+        assert calculate_diff(frame, frame[:, :]) == 0.0
+
+    def test_overlapping_views_still_diffed(self) -> None:
+        """Views with the same start but different strides are not equal frames."""
+        base = np.arange(200, dtype=np.uint8).reshape(10, 20)
+        diff = calculate_diff(base[:, :10], base[:, ::2])
+        assert diff > 0.0
+
     def test_maximum_difference_returns_one(self) -> None:
         """Black vs white frames should produce diff = 1.0."""
         frame_black = np.zeros((100, 100), dtype=np.uint8)
@@ -34,11 +60,10 @@ class TestDiffCalculation:
 
     def test_diff_in_valid_range(self) -> None:
         """Diff should always be in [0, 1]."""
-        # Test with random frames
-        np.random.seed(42)
-        for _ in range(10):
-            frame_t0 = np.random.randint(0, 256, (50, 50), dtype=np.uint8)
-            frame_t = np.random.randint(0, 256, (50, 50), dtype=np.uint8)
+        # Test with random frames, generated in one batch
+        rng = np.random.default_rng(42)
+        frames = rng.integers(0, 256, size=(10, 2, 50, 50), dtype=np.uint8)
+        for frame_t, frame_t0 in frames:
             diff = calculate_diff(frame_t, frame_t0)
             assert 0.0 <= diff <= 1.0, f"Diff {diff} out of range [0, 1]"
 
@@ -51,6 +76,15 @@ class TestDiffCalculation:
         expected = 50.0 / 255.0
         assert diff == pytest.approx(expected, abs=0.001)
 
+    def test_tiny_frames_match_numpy_path(self) -> None:
+        """Frames below DIFF_TINY_MAX_PIXELS should give the exact NumPy result."""
+        rng = np.random.default_rng(7)
+        for shape in [(1, 1), (2, 2), (3, 5), (6, 7)]:
+            frame_t = rng.integers(0, 256, size=shape, dtype=np.uint8)
+            frame_t0 = rng.integers(0, 256, size=shape, dtype=np.uint8)
+
+            assert calculate_diff(frame_t, frame_t0) == _sad_u8(_absdiff_u8(frame_t, frame_t0))
+
     def test_shape_mismatch_raises_error(self) -> None:
         """Frames with different shapes should raise ValueError."""
         frame_t0 = np.zeros((100, 100), dtype=np.uint8)
@@ -110,6 +144,26 @@ class TestGrayscaleConversion:
         expected = 0.114 * 255
         assert gray[0, 0] == pytest.approx(expected, abs=1.0)
 
+    def test_grayscale_rounds_to_nearest(self) -> None:
+        """Pin Y = (77*R + 150*G + 29*B + 128) >> 8 for known colors.
+
+        The +128 rounds to nearest: pure red gives 77 where truncating
+        0.299 * 255 = 76.245 would give 76.
+        """
+        bgra = np.array(
+            [[
+                [0, 0, 255, 255],  # Pure red: 19763 >> 8 = 77
+                [0, 255, 0, 255],  # Pure green: 38378 >> 8 = 149
+                [255, 0, 0, 255],  # Pure blue: 7523 >> 8 = 29
+                [100, 150, 200, 255],  # 40928 >> 8 = 159
+                [255, 255, 255, 255],  # White stays 255
+                [0, 0, 0, 255],  # Black stays 0
+            ]],
+            dtype=np.uint8,
+        )
+        gray = to_grayscale(bgra)
+        assert gray.tolist() == [[77, 149, 29, 159, 255, 0]]
+
     def test_grayscale_already_gray_passthrough(self) -> None:
         """Already grayscale (2D) array should pass through unchanged."""
         gray_input = np.array([[100, 150], [200, 50]], dtype=np.uint8)
@@ -142,3 +196,87 @@ class TestDiffWithROI:
         assert diff_with_roi == pytest.approx(diff_no_roi, abs=0.0001)
 
 
+class TestDiffBatch:
+    """Test calculate_diff_batch against per-frame calculate_diff."""
+
+    def test_batch_matches_single_calls(self) -> None:
+        """Each batch entry should equal the single-frame diff."""
+        rng = np.random.default_rng(11)
+        frame_t0 = rng.integers(0, 256, (30, 40), dtype=np.uint8)
+        frames_t = rng.integers(0, 256, (5, 30, 40), dtype=np.uint8)
+
+        for roi in (
+            None,
+            ROI(shape=ROIShape.CIRCLE, rect=Rect(x=0, y=0, w=40, h=30)),
+        ):
+            diffs = calculate_diff_batch(frames_t, frame_t0, roi)
+            expected = [calculate_diff(f, frame_t0, roi) for f in frames_t]
+            assert diffs.tolist() == expected
+
+    def test_batch_shape_mismatch_raises(self) -> None:
+        """A frame of the wrong shape should raise like calculate_diff."""
+        frame_t0 = np.zeros((10, 10), dtype=np.uint8)
+        with pytest.raises(ValueError, match="Frame shapes must match"):
+            calculate_diff_batch([frame_t0, np.zeros((10, 11), dtype=np.uint8)], frame_t0)
+
+
+class TestDiffPrecision:
+    """Test the decimated fast precision mode."""
+
+    def test_fast_mode_large_frame(self) -> None:
+        """Fast mode on a large frame should be within 0.01 of full."""
+        rng = np.random.default_rng(7)
+        frame_t0 = rng.integers(0, 256, (480, 640), dtype=np.uint8)
+        frame_t = frame_t0.copy()
+        frame_t[100:300, 200:500] = rng.integers(0, 256, (200, 300), dtype=np.uint8)
+
+        full = calculate_diff(frame_t, frame_t0)
+        fast = calculate_diff(frame_t, frame_t0, precision="fast")
+
+        assert fast == pytest.approx(full, abs=0.01)
+
+    def test_fast_mode_small_frame_is_exact(self) -> None:
+        """Frames at or below the size cutoff are never decimated."""
+        rng = np.random.default_rng(8)
+        frame_t0 = rng.integers(0, 256, (64, 64), dtype=np.uint8)
+        frame_t = rng.integers(0, 256, (64, 64), dtype=np.uint8)
+
+        assert calculate_diff(frame_t, frame_t0, precision="fast") == calculate_diff(
+            frame_t, frame_t0
+        )
+
+    def test_fast_mode_circle_mask(self) -> None:
+        """Fast mode should decimate a given circle mask along with the frames."""
+        roi = ROI(shape=ROIShape.CIRCLE, rect=Rect(x=0, y=0, w=400, h=400))
+        mask = create_circle_mask(400, 400, roi.circle)  # type: ignore
+        frame_t0 = np.zeros((400, 400), dtype=np.uint8)
+        frame_t = np.where(mask, 200, 0).astype(np.uint8)
+
+        fast = calculate_diff(frame_t, frame_t0, roi, mask, precision="fast")
+
+        assert fast == pytest.approx(200 / 255.0)
+
+
+class TestDiffScratchReuse:
+    """Test that calculate_diff reuses its absdiff scratch buffers."""
+
+    def test_scratch_reused_for_same_shape(self) -> None:
+        """Repeated diffs of the same shape should not reallocate scratch."""
+        frame_t0 = np.zeros((40, 60), dtype=np.uint8)
+        frame_t = np.full((40, 60), 10, dtype=np.uint8)
+
+        calculate_diff(frame_t, frame_t0)
+        scratch_id = id(_absdiff_scratch((40, 60)))
+
+        diff = calculate_diff(frame_t0, frame_t)
+
+        assert id(_absdiff_scratch((40, 60))) == scratch_id
+        assert diff == pytest.approx(10 / 255.0)
+
+    def test_scratch_reallocated_on_shape_change(self) -> None:
+        """A new ROI shape should get correctly sized scratch."""
+        calculate_diff(np.zeros((40, 60), dtype=np.uint8), np.zeros((40, 60), dtype=np.uint8))
+        diff = calculate_diff(np.full((9, 11), 255, dtype=np.uint8), np.zeros((9, 11), dtype=np.uint8))
+
+        assert _absdiff_scratch((9, 11)).shape == (9, 11)
+        assert diff == pytest.approx(1.0)
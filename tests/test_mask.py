@@ -11,10 +11,24 @@ See Executable Spec Sections 4.2 and 7.1 for requirements.
 import numpy as np
 import pytest
 
-from app.core.diff import calculate_diff, create_circle_mask
+from app.core.diff import calculate_diff, create_circle_mask, make_diff_kernel
 from app.core.model import ROI, Rect, Circle, ROIShape
 
 
+# Test fixtures
+@pytest.fixture(scope="module")
+def baseline_100() -> tuple[np.ndarray, ROI, np.ndarray]:
+    """Shared 100x100 reference frame (all 100), inscribed circle ROI and mask.
+
+    The frame is read-only; tests build changed frames instead of
+    mutating it.
+    """
+    frame_t0 = np.full((100, 100), 100, dtype=np.uint8)
+    frame_t0.flags.writeable = False
+    roi = ROI(shape=ROIShape.CIRCLE, rect=Rect(x=0, y=0, w=100, h=100))
+    return frame_t0, roi, create_circle_mask(100, 100, roi.circle)  # type: ignore
+
+
 class TestCircleMaskCreation:
     """Test suite for circle mask generation."""
 
@@ -31,16 +45,14 @@ class TestCircleMaskCreation:
     def test_center_pixel_is_inside(self) -> None:
         """Center of circle should be inside the mask."""
         mask = create_circle_mask(100, 100, Circle(50.0, 50.0, 30.0))
-        assert mask[50, 50] is np.True_
+        assert mask[50, 50]
 
     def test_corner_pixels_are_outside(self) -> None:
         """Corner pixels should be outside the inscribed circle."""
         mask = create_circle_mask(100, 100, Circle(50.0, 50.0, 30.0))
         # Corners at (0,0), (0,99), (99,0), (99,99) are all outside a r=30 circle
-        assert mask[0, 0] is np.False_
-        assert mask[0, 99] is np.False_
-        assert mask[99, 0] is np.False_
-        assert mask[99, 99] is np.False_
+        corners = mask[[0, 0, 99, 99], [0, 99, 0, 99]]
+        assert not corners.any()
 
     def test_inscribed_circle_from_square(self) -> None:
         """Inscribed circle in a square should touch midpoints of edges."""
@@ -50,10 +62,10 @@ class TestCircleMaskCreation:
         # Edge midpoints should be inside (or on boundary)
         # Top midpoint: (50, 0) should be on the boundary
         # The formula is: dist(50, 0) to (50, 50) = 50 = r, so on boundary
-        assert mask[0, 50] is np.True_  # top edge midpoint
-        assert mask[99, 50] is np.True_  # bottom edge midpoint (99 is inside since < 100)
-        assert mask[50, 0] is np.True_  # left edge midpoint
-        assert mask[50, 99] is np.True_  # right edge midpoint
+        assert mask[0, 50]  # top edge midpoint
+        assert mask[99, 50]  # bottom edge midpoint (99 is inside since < 100)
+        assert mask[50, 0]  # left edge midpoint
+        assert mask[50, 99]  # right edge midpoint
 
     def test_inscribed_circle_from_rectangle(self) -> None:
         """Inscribed circle in rectangle uses min(w,h)/2 as radius."""
@@ -62,89 +74,70 @@ class TestCircleMaskCreation:
         mask = create_circle_mask(100, 200, Circle(100.0, 50.0, 50.0))
 
         # Point at center should be inside
-        assert mask[50, 100] is np.True_
+        assert mask[50, 100]
 
         # Points near horizontal edges of rectangle but within circle
-        assert mask[50, 60] is np.True_   # 60 is within radius of center 100
-        assert mask[50, 140] is np.True_  # 140 is within radius of center 100
+        assert mask[50, 60]   # 60 is within radius of center 100
+        assert mask[50, 140]  # 140 is within radius of center 100
 
         # Points outside the inscribed circle (beyond r=50 from center)
         # At x=0 or x=199, far from center x=100
-        assert mask[50, 0] is np.False_
-        assert mask[50, 199] is np.False_
+        assert not mask[50, 0]
+        assert not mask[50, 199]
+
+    def test_mask_cached_and_read_only(self) -> None:
+        """Masks for the same frame size should be one shared read-only array."""
+        circle = Circle(50.0, 50.0, 50.0)
+        mask = create_circle_mask(100, 100, circle)
+        assert create_circle_mask(100, 100, circle) is mask
+        assert not mask.flags.writeable
+        with pytest.raises(ValueError):
+            mask[0, 0] = True
 
 
 class TestCircleMaskInDiff:
     """Test that circle mask correctly filters diff calculation."""
 
-    def test_outer_changes_ignored(self) -> None:
+    def test_outer_changes_ignored(
+        self, baseline_100: tuple[np.ndarray, ROI, np.ndarray]
+    ) -> None:
         """Changes outside the circle should not affect diff."""
-        size = 100
-        frame_t0 = np.full((size, size), 100, dtype=np.uint8)
-        frame_t = frame_t0.copy()
-
-        # Create inscribed circle ROI
-        roi = ROI(
-            shape=ROIShape.CIRCLE,
-            rect=Rect(x=0, y=0, w=size, h=size),
-        )
-
-        # Get the mask to identify outside pixels
-        mask = create_circle_mask(size, size, roi.circle)
+        frame_t0, roi, mask = baseline_100
 
         # Only change pixels OUTSIDE the circle
-        frame_t[~mask] = 255
+        frame_t = np.where(mask, frame_t0, np.uint8(255))
 
         # Diff should be 0 since only outside pixels changed
         diff = calculate_diff(frame_t, frame_t0, roi)
-        assert diff == pytest.approx(0.0, abs=0.001)
+        assert abs(diff) <= 0.001
 
-    def test_inner_changes_counted(self) -> None:
+    def test_inner_changes_counted(
+        self, baseline_100: tuple[np.ndarray, ROI, np.ndarray]
+    ) -> None:
         """Changes inside the circle should be correctly counted in diff."""
-        size = 100
-        frame_t0 = np.full((size, size), 100, dtype=np.uint8)
-        frame_t = frame_t0.copy()
-
-        # Create inscribed circle ROI
-        roi = ROI(
-            shape=ROIShape.CIRCLE,
-            rect=Rect(x=0, y=0, w=size, h=size),
-        )
-
-        # Get the mask
-        mask = create_circle_mask(size, size, roi.circle)
+        frame_t0, roi, mask = baseline_100
 
         # Only change pixels INSIDE the circle
-        frame_t[mask] = 200  # +100 change
+        frame_t = np.where(mask, np.uint8(200), frame_t0)  # +100 change
 
         # Diff should reflect the change (100/255 ≈ 0.392)
         diff = calculate_diff(frame_t, frame_t0, roi)
         expected = 100.0 / 255.0
-        assert diff == pytest.approx(expected, abs=0.01)
+        assert abs(diff - expected) <= 0.01
 
-    def test_mixed_changes_only_counts_inner(self) -> None:
+    def test_mixed_changes_only_counts_inner(
+        self, baseline_100: tuple[np.ndarray, ROI, np.ndarray]
+    ) -> None:
         """When both inside and outside change, only inside is counted."""
-        size = 100
-        frame_t0 = np.full((size, size), 100, dtype=np.uint8)
-        frame_t = frame_t0.copy()
-
-        roi = ROI(
-            shape=ROIShape.CIRCLE,
-            rect=Rect(x=0, y=0, w=size, h=size),
-        )
-
-        mask = create_circle_mask(size, size, roi.circle)
-
-        # Inside: change by 50
-        frame_t[mask] = 150
+        frame_t0, roi, mask = baseline_100
 
-        # Outside: change by 100 (should be ignored)
-        frame_t[~mask] = 200
+        # Inside: change by 50; outside: change by 100 (should be ignored)
+        frame_t = np.where(mask, 150, 200).astype(np.uint8)
 
         # Diff should only reflect inside change
         diff = calculate_diff(frame_t, frame_t0, roi)
         expected = 50.0 / 255.0
-        assert diff == pytest.approx(expected, abs=0.01)
+        assert abs(diff - expected) <= 0.01
 
     def test_rectangle_roi_counts_all_pixels(self) -> None:
         """Rectangle ROI should count all pixels, not just a circle."""
@@ -185,6 +178,41 @@ class TestCircleMaskInDiff:
         assert 0.0 <= diff <= 1.0
 
 
+class TestDiffKernel:
+    """Test diff functions specialized per ROI with make_diff_kernel."""
+
+    def test_circle_kernel_uses_mask(self) -> None:
+        """Circle kernel should ignore outside changes and match calculate_diff."""
+        size = 100
+        frame_t0 = np.full((size, size), 100, dtype=np.uint8)
+        roi = ROI(shape=ROIShape.CIRCLE, rect=Rect(x=0, y=0, w=size, h=size))
+        mask = create_circle_mask(size, size, roi.circle)
+        frame_t = np.where(mask, 150, 255).astype(np.uint8)
+
+        kernel = make_diff_kernel(roi, frame_t0.shape)
+
+        assert kernel(frame_t, frame_t0) == calculate_diff(frame_t, frame_t0, roi)
+        assert kernel(frame_t, frame_t0) == pytest.approx(50.0 / 255.0)
+
+    def test_rect_kernel_matches_calculate_diff(self) -> None:
+        """Rect (and no-ROI) kernels should count every pixel."""
+        rng = np.random.default_rng(3)
+        frame_t0 = rng.integers(0, 256, (30, 40), dtype=np.uint8)
+        frame_t = rng.integers(0, 256, (30, 40), dtype=np.uint8)
+        roi = ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=40, h=30))
+
+        expected = calculate_diff(frame_t, frame_t0)
+        assert make_diff_kernel(roi, (30, 40))(frame_t, frame_t0) == expected
+        assert make_diff_kernel(None, (30, 40))(frame_t, frame_t0) == expected
+
+    def test_kernel_rejects_other_shapes(self) -> None:
+        """Frames of a different shape than the kernel was built for should raise."""
+        kernel = make_diff_kernel(None, (10, 10))
+        frame = np.zeros((10, 12), dtype=np.uint8)
+        with pytest.raises(ValueError, match="Frame shapes must match"):
+            kernel(frame, frame)
+
+
 class TestMaskEdgeCases:
     """Edge cases for mask behavior."""
 
@@ -192,16 +220,16 @@ class TestMaskEdgeCases:
         """Very small circles should still work correctly."""
         mask = create_circle_mask(10, 10, Circle(5.0, 5.0, 2.0))
         # Center should be inside
-        assert mask[5, 5] is np.True_
+        assert mask[5, 5]
         # Corners should be outside
-        assert mask[0, 0] is np.False_
+        assert not mask[0, 0]
 
     def test_large_circle(self) -> None:
         """Large circles should work correctly."""
         mask = create_circle_mask(1000, 1000, Circle(500.0, 500.0, 400.0))
-        assert mask[500, 500] is np.True_
-        assert mask[0, 0] is np.False_
-        assert mask[999, 999] is np.False_
+        assert mask[500, 500]
+        assert not mask[0, 0]
+        assert not mask[999, 999]
 
     def test_non_square_aspect_ratio(self) -> None:
         """Non-square images should use min(w,h)/2 for inscribed circle."""
@@ -209,10 +237,24 @@ class TestMaskEdgeCases:
         mask = create_circle_mask(50, 200, Circle(100.0, 25.0, 25.0))
 
         # Center should be inside
-        assert mask[25, 100] is np.True_
+        assert mask[25, 100]
 
         # Points at horizontal extremes should be outside (beyond radius)
-        assert mask[25, 0] is np.False_
-        assert mask[25, 199] is np.False_
+        assert not mask[25, 0]
+        assert not mask[25, 199]
+
+    def test_empty_mask_skips_frame_diff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A circle with no pixels should return 0 without diffing the frames."""
+        import app.core.diff as diff_module
+
+        def fail(*args: object) -> None:
+            raise AssertionError("absdiff kernel should not run")
 
+        monkeypatch.setattr(diff_module, "_absdiff_u8", fail)
+        # 1x1 frame: pixel (0, 0) is sqrt(0.5) from the center (0.5, 0.5),
+        # outside r = 0.5, so the mask is empty
+        roi = ROI(shape=ROIShape.CIRCLE, rect=Rect(x=0, y=0, w=1, h=1))
+        frame_t0 = np.zeros((1, 1), dtype=np.uint8)
+        frame_t = np.full((1, 1), 255, dtype=np.uint8)
 
+        assert calculate_diff(frame_t, frame_t0, roi) == 0.0
@@ -10,6 +10,8 @@ See Executable Spec Section 5.1 for requirements.
 
 import pytest
 
+from app.core.progress import progress_labels
+
 
 def filter_messages(messages_raw: list[str]) -> list[str]:
     """Filter empty messages as specified.
@@ -23,7 +25,7 @@ def filter_messages(messages_raw: list[str]) -> list[str]:
     Returns:
         Filtered list with only non-empty messages
     """
-    return [m.strip() for m in messages_raw if m.strip()]
+    return [s for m in messages_raw if (s := m.strip())]
 
 
 class TestMessageFiltering:
@@ -136,27 +138,19 @@ class TestProgressDisplayIndexing:
         messages = filter_messages(["a", "b", "c"])
         n = len(messages)
 
-        # Simulate processing - first message (index 0) displays as 1/N
-        for idx in range(n):
-            display_idx = idx + 1  # Convert 0-based to 1-based
-            progress = f"{display_idx}/{n}"
-
-            if idx == 0:
-                assert progress == "1/3"
-            elif idx == 1:
-                assert progress == "2/3"
-            elif idx == 2:
-                assert progress == "3/3"
+        # First message (index 0) displays as 1/N
+        assert progress_labels(n) == ["1/3", "2/3", "3/3"]
 
     def test_progress_format(self) -> None:
         """Progress should be in format 'i/N' where i is 1-based."""
         messages = filter_messages(["msg1", "msg2", "", "msg3", ""])
         n = len(messages)  # Should be 3
 
-        expected_progress = ["1/3", "2/3", "3/3"]
-        for idx in range(n):
-            progress = f"{idx + 1}/{n}"
-            assert progress == expected_progress[idx]
+        assert progress_labels(n) == ["1/3", "2/3", "3/3"]
+
+    def test_no_messages_no_labels(self) -> None:
+        """Zero messages should produce no progress texts."""
+        assert progress_labels(0) == []
 
 
 class TestMessageContentPreservation:
@@ -9,6 +9,11 @@ Verifies that:
 See Executable Spec Sections 9 and 10 for requirements.
 """
 
+import operator
+from collections.abc import Callable
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
+
 import pytest
 from unittest.mock import MagicMock, patch
 import numpy as np
@@ -16,6 +21,121 @@ import numpy as np
 from app.core.model import State, Point, Rect, ROI, ROIShape, CalibrationConfig
 from app.core.diff import HoldHitsTracker, DiffCalculator
 
+if TYPE_CHECKING:
+    from app.core.engine import AutomationWorker
+
+
+# Resume check as done by the engine: any difference in the message
+# list since the pause means stop
+_check_messages_changed = operator.ne
+
+# States Stop can be requested from
+_RUNNING_STATES = (
+    State.Countdown,
+    State.Sending,
+    State.Cooling,
+    State.WaitingHold,
+    State.Paused,
+)
+
+
+# Minimal state machine stand-ins, defined once rather than per test
+class _MockStateMachine:
+    """Tracks state across stop/pause/resume."""
+
+    __slots__ = ("state", "paused_from_state")
+
+    def __init__(self, state: State = State.Idle) -> None:
+        self.state = state
+        self.paused_from_state: State | None = None
+
+    def stop(self) -> None:
+        self.state = State.Idle
+
+    def pause(self) -> None:
+        self.paused_from_state = self.state
+        self.state = State.Paused
+
+    def resume(self) -> None:
+        if self.paused_from_state:
+            self.state = self.paused_from_state
+
+
+class _MockIndexStateMachine:
+    """Freezes the current message index across pause/resume."""
+
+    __slots__ = ("current_idx", "frozen_idx")
+
+    def __init__(self) -> None:
+        self.current_idx = 2
+        self.frozen_idx: int | None = None
+
+    def pause(self) -> None:
+        self.frozen_idx = self.current_idx
+
+    def resume(self) -> None:
+        self.current_idx = self.frozen_idx  # type: ignore
+
+
+class _MockResumeStateMachine:
+    """Stops on resume if the message list changed during pause."""
+
+    __slots__ = ("state", "messages_snapshot", "dialog_shown")
+
+    def __init__(self, messages_snapshot: list[str]) -> None:
+        self.state = State.Paused
+        self.messages_snapshot = messages_snapshot
+        self.dialog_shown = False
+
+    def resume(self, current_messages: list[str]) -> bool:
+        """Returns True if resumed successfully, False if stopped."""
+        if current_messages != self.messages_snapshot:
+            self.state = State.Idle
+            self.dialog_shown = True
+            return False
+        return True
+
+
+# Test fixtures
+def _reference_frame(value: int) -> np.ndarray:
+    """Read-only 50x50 frame filled with value."""
+    frame = np.full((50, 50), value, dtype=np.uint8)
+    frame.flags.writeable = False
+    return frame
+
+
+@pytest.fixture(scope="module")
+def roi_50() -> ROI:
+    """Shared 50x50 rect ROI (ROI is frozen, so one instance is enough)."""
+    return ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=50, h=50))
+
+
+@pytest.fixture(scope="module")
+def ref_frame_128() -> np.ndarray:
+    return _reference_frame(128)
+
+
+@pytest.fixture(scope="module")
+def ref_frame_100() -> np.ndarray:
+    return _reference_frame(100)
+
+
+@pytest.fixture(scope="module")
+def ref_frame_zero() -> np.ndarray:
+    return _reference_frame(0)
+
+
+@pytest.fixture(scope="module")
+def _calc_50(roi_50: ROI) -> DiffCalculator:
+    return DiffCalculator(roi_50, threshold=0.02)
+
+
+@pytest.fixture
+def calc(_calc_50: DiffCalculator) -> DiffCalculator:
+    """The shared DiffCalculator, reset to its freshly constructed state."""
+    _calc_50.reset()
+    return _calc_50
+
 
 class TestStateEnumValues:
     """Test that all required states exist."""
@@ -43,8 +163,10 @@ class TestStateEnumValues:
             State.WaitingHold,
             State.Paused,
         ]
-        # Convert to set to check uniqueness
-        assert len(set(states)) == len(states)
+        # An Enum member with a repeated value becomes an alias: it shows
+        # up in __members__ but not in iteration, so equal counts mean
+        # every name has its own value
+        assert len(State.__members__) == len(State) == len(states)
 
 
 class TestHoldHitsPreservation:
@@ -53,11 +175,9 @@ class TestHoldHitsPreservation:
     def test_hold_hits_preserved_after_freeze(self) -> None:
         """hold_hits should be preserved when freezing state."""
         tracker = HoldHitsTracker()
-        threshold = 0.02
 
-        # Build up hold_hits
-        tracker.update(0.03, threshold)
-        tracker.update(0.03, threshold)
+        # Simulate two hits (update() itself is covered in test_hold_hits_reset)
+        tracker._hold_hits = 2
         assert tracker.hold_hits == 2
 
         # Simulate freeze by saving value
@@ -69,10 +189,9 @@ class TestHoldHitsPreservation:
     def test_hold_hits_restored_after_resume(self) -> None:
         """hold_hits should be restored on resume."""
         tracker = HoldHitsTracker()
-        threshold = 0.02
 
-        # Build up hold_hits
-        tracker.update(0.03, threshold)
+        # Simulate one hit
+        tracker._hold_hits = 1
         assert tracker.hold_hits == 1
 
         # Freeze
@@ -90,38 +209,28 @@ class TestHoldHitsPreservation:
 class TestDiffCalculatorStatePreservation:
     """Test DiffCalculator freeze/restore for pause/resume."""
 
-    def test_freeze_captures_frame_t0_and_hold_hits(self) -> None:
+    def test_freeze_captures_frame_t0_and_hold_hits(
+        self, calc: DiffCalculator, ref_frame_128: np.ndarray
+    ) -> None:
         """freeze_state should capture frame_t0 and hold_hits."""
-        roi = ROI(
-            shape=ROIShape.RECT,
-            rect=Rect(x=0, y=0, w=50, h=50),
-        )
-        calc = DiffCalculator(roi, threshold=0.02)
-
         # Set up state
-        test_frame = np.full((50, 50), 128, dtype=np.uint8)
-        calc.set_reference(test_frame)
+        calc.set_reference(ref_frame_128)
         calc._tracker._hold_hits = 1  # Simulate partial hits
 
         # Freeze
         state = calc.freeze_state()
 
-        assert state["frame_t0"] is not None
-        assert state["hold_hits"] == 1
+        assert state.frame_t0 is not None
+        assert state.hold_hits == 1
         # Verify frame is a copy
-        assert state["frame_t0"] is not calc._frame_t0
+        assert state.frame_t0 is not calc._frame_t0
 
-    def test_restore_applies_frozen_state(self) -> None:
+    def test_restore_applies_frozen_state(
+        self, calc: DiffCalculator, ref_frame_128: np.ndarray
+    ) -> None:
         """restore_state should restore frame_t0 and hold_hits."""
-        roi = ROI(
-            shape=ROIShape.RECT,
-            rect=Rect(x=0, y=0, w=50, h=50),
-        )
-        calc = DiffCalculator(roi, threshold=0.02)
-
         # Set up initial state
-        original_frame = np.full((50, 50), 128, dtype=np.uint8)
-        calc.set_reference(original_frame)
+        calc.set_reference(ref_frame_128)
         calc._tracker._hold_hits = 1
 
         # Freeze
@@ -137,76 +246,54 @@ class TestDiffCalculatorStatePreservation:
         assert calc.frame_t0 is not None
         assert calc.hold_hits == 1
 
-    def test_frame_t0_preserved_during_pause(self) -> None:
+    def test_frame_t0_preserved_during_pause(
+        self, calc: DiffCalculator, ref_frame_100: np.ndarray
+    ) -> None:
         """frame_t0 should not change during pause (frozen)."""
-        roi = ROI(
-            shape=ROIShape.RECT,
-            rect=Rect(x=0, y=0, w=50, h=50),
-        )
-        calc = DiffCalculator(roi, threshold=0.02)
-
         # Set reference frame
-        original_frame = np.full((50, 50), 100, dtype=np.uint8)
-        calc.set_reference(original_frame)
+        calc.set_reference(ref_frame_100)
 
         # Freeze
         frozen = calc.freeze_state()
-        frozen_frame = frozen["frame_t0"]
+        frozen_frame = frozen.frame_t0
 
         # Verify the frozen frame matches original
-        np.testing.assert_array_equal(frozen_frame, original_frame)
+        assert np.array_equal(frozen_frame, ref_frame_100)
 
+    def test_frozen_state_comparable_and_hashable(
+        self, calc: DiffCalculator, ref_frame_100: np.ndarray
+    ) -> None:
+        """Frozen states should compare and hash despite the ndarray field."""
+        calc.set_reference(ref_frame_100)
+        first = calc.freeze_state()
+        second = calc.freeze_state()
 
-class TestMessageChangeDetection:
-    """Test message list change detection on resume."""
+        assert first == first
+        assert first != second
+        assert len({first, second}) == 2
 
-    def test_no_change_detected_when_lists_equal(self) -> None:
-        """No change should be detected if lists are equal."""
-        snapshot = ["msg1", "msg2", "msg3"]
-        current = ["msg1", "msg2", "msg3"]
-
-        changed = snapshot != current
-        assert changed is False
-
-    def test_change_detected_when_message_removed(self) -> None:
-        """Change should be detected when a message is removed."""
-        snapshot = ["msg1", "msg2", "msg3"]
-        current = ["msg1", "msg2"]  # msg3 removed
-
-        changed = snapshot != current
-        assert changed is True
-
-    def test_change_detected_when_message_added(self) -> None:
-        """Change should be detected when a message is added."""
-        snapshot = ["msg1", "msg2"]
-        current = ["msg1", "msg2", "msg3"]  # msg3 added
-
-        changed = snapshot != current
-        assert changed is True
-
-    def test_change_detected_when_message_modified(self) -> None:
-        """Change should be detected when a message is modified."""
-        snapshot = ["msg1", "msg2", "msg3"]
-        current = ["msg1", "modified", "msg3"]  # msg2 modified
 
-        changed = snapshot != current
-        assert changed is True
-
-    def test_change_detected_when_order_changed(self) -> None:
-        """Change should be detected when order changes."""
-        snapshot = ["msg1", "msg2", "msg3"]
-        current = ["msg2", "msg1", "msg3"]  # Reordered
-
-        changed = snapshot != current
-        assert changed is True
-
-    def test_no_change_for_empty_lists(self) -> None:
-        """No change for two empty lists."""
-        snapshot: list[str] = []
-        current: list[str] = []
+class TestMessageChangeDetection:
+    """Test message list change detection on resume."""
 
+    @pytest.mark.parametrize(
+        ("snapshot", "current", "expected"),
+        [
+            (("msg1", "msg2", "msg3"), ("msg1", "msg2", "msg3"), False),
+            (("msg1", "msg2", "msg3"), ("msg1", "msg2"), True),  # msg3 removed
+            (("msg1", "msg2"), ("msg1", "msg2", "msg3"), True),  # msg3 added
+            (("msg1", "msg2", "msg3"), ("msg1", "modified", "msg3"), True),  # msg2 modified
+            (("msg1", "msg2", "msg3"), ("msg2", "msg1", "msg3"), True),  # Reordered
+            ((), (), False),
+        ],
+        ids=["equal", "removed", "added", "modified", "reordered", "both_empty"],
+    )
+    def test_change_detection(
+        self, snapshot: tuple[str, ...], current: tuple[str, ...], expected: bool
+    ) -> None:
+        """Any removal, addition, edit or reorder counts as a change."""
         changed = snapshot != current
-        assert changed is False
+        assert changed is expected
 
 
 class TestResumeWithMessageChange:
@@ -215,90 +302,41 @@ class TestResumeWithMessageChange:
     def test_resume_returns_false_on_message_change(self) -> None:
         """Resume should indicate failure when messages changed."""
         # Simulate the check that would happen in engine
-        def check_messages_changed(snapshot: list[str], current: list[str]) -> bool:
-            return snapshot != current
-
         snapshot = ["msg1", "msg2", "msg3"]
         current = ["msg1", "msg2"]  # Changed
 
         # This would trigger EV_MSG_LIST_CHANGED -> Stop
-        should_stop = check_messages_changed(snapshot, current)
+        should_stop = _check_messages_changed(snapshot, current)
         assert should_stop is True
 
     def test_resume_continues_when_messages_unchanged(self) -> None:
         """Resume should continue when messages unchanged."""
-        def check_messages_changed(snapshot: list[str], current: list[str]) -> bool:
-            return snapshot != current
-
         snapshot = ["msg1", "msg2", "msg3"]
         current = ["msg1", "msg2", "msg3"]  # Same
 
-        should_stop = check_messages_changed(snapshot, current)
+        should_stop = _check_messages_changed(snapshot, current)
         assert should_stop is False
 
 
 class TestStopBehavior:
     """Test Stop returns to Idle immediately."""
 
-    def test_stop_sets_idle_state(self) -> None:
-        """Stop should transition to Idle state."""
-        # Simulate state machine
-        class MockStateMachine:
-            def __init__(self) -> None:
-                self.state = State.WaitingHold
-
-            def stop(self) -> None:
-                self.state = State.Idle
-
-        sm = MockStateMachine()
-        assert sm.state == State.WaitingHold
+    @pytest.mark.parametrize("initial_state", _RUNNING_STATES, ids=lambda s: s.name)
+    def test_stop_from_any_running_state(self, initial_state: State) -> None:
+        """Stop should transition any running state to Idle."""
+        sm = _MockStateMachine(initial_state)
+        assert sm.state == initial_state
 
         sm.stop()
         assert sm.state == State.Idle
 
-    def test_stop_from_any_running_state(self) -> None:
-        """Stop should work from any running state."""
-        running_states = [
-            State.Countdown,
-            State.Sending,
-            State.Cooling,
-            State.WaitingHold,
-            State.Paused,
-        ]
-
-        for initial_state in running_states:
-            class MockStateMachine:
-                def __init__(self, state: State) -> None:
-                    self.state = state
-
-                def stop(self) -> None:
-                    self.state = State.Idle
-
-            sm = MockStateMachine(initial_state)
-            sm.stop()
-            assert sm.state == State.Idle, f"Stop from {initial_state} should go to Idle"
-
 
 class TestPauseBehavior:
     """Test Pause behavior per spec."""
 
     def test_pause_freezes_current_state(self) -> None:
         """Pause should preserve the pre-pause state for later resume."""
-
-        class MockStateMachine:
-            def __init__(self) -> None:
-                self.state = State.WaitingHold
-                self.paused_from_state: State | None = None
-
-            def pause(self) -> None:
-                self.paused_from_state = self.state
-                self.state = State.Paused
-
-            def resume(self) -> None:
-                if self.paused_from_state:
-                    self.state = self.paused_from_state
-
-        sm = MockStateMachine()
+        sm = _MockStateMachine(State.WaitingHold)
         assert sm.state == State.WaitingHold
 
         sm.pause()
@@ -310,19 +348,7 @@ class TestPauseBehavior:
 
     def test_pause_preserves_message_index(self) -> None:
         """Pause should preserve current message index."""
-
-        class MockStateMachine:
-            def __init__(self) -> None:
-                self.current_idx = 2
-                self.frozen_idx: int | None = None
-
-            def pause(self) -> None:
-                self.frozen_idx = self.current_idx
-
-            def resume(self) -> None:
-                self.current_idx = self.frozen_idx  # type: ignore
-
-        sm = MockStateMachine()
+        sm = _MockIndexStateMachine()
         sm.current_idx = 5
 
         sm.pause()
@@ -335,97 +361,175 @@ class TestPauseBehavior:
         assert sm.current_idx == 5
 
 
+@pytest.fixture(scope="module")
+def engine_module() -> ModuleType:
+    """app.core.engine, skipped where the input backend is unavailable."""
+    pytest.importorskip("pynput")
+    from app.core import engine
+
+    return engine
+
+
+def _run_worker(
+    engine_module: ModuleType,
+    messages: list[str],
+    on_state: Optional[Callable[["AutomationWorker", State], None]] = None,
+) -> list[State]:
+    """Run AutomationWorker synchronously and return the states it entered.
+
+    Input injection and sleeps are mocked out. Every sample differs fully
+    from the reference frame, so each message passes after
+    HOLD_HITS_REQUIRED samples.
+
+    Args:
+        engine_module: The app.core.engine module
+        messages: Messages to send
+        on_state: Optional hook called on each state change, e.g. to
+            request pause/resume/stop at a given state
+    """
+    config = CalibrationConfig(
+        roi=ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=50, h=50)),
+        input_point=Point(x=10, y=10),
+        send_point=Point(x=20, y=20),
+        th_hold=0.02,
+    )
+    reference = np.zeros((50, 50), dtype=np.uint8)
+    changed = np.full((50, 50), 255, dtype=np.uint8)
+
+    # Per message: frame_t0, then HOLD_HITS_REQUIRED changed samples
+    captures_per_message = engine_module.HOLD_HITS_REQUIRED + 1
+    captures = {"count": 0}
+
+    def capture(roi: ROI) -> np.ndarray:
+        captures["count"] += 1
+        return reference if captures["count"] % captures_per_message == 1 else changed
+
+    worker = engine_module.AutomationWorker(messages, config, logger=MagicMock())
+    states: list[State] = []
+
+    def record(state: State) -> None:
+        states.append(state)
+        if on_state is not None:
+            on_state(worker, state)
+
+    worker.state_changed.connect(record)
+    with patch.object(engine_module, "click_point"), \
+            patch.object(engine_module, "paste_text", return_value=True), \
+            patch.object(engine_module, "capture_roi_gray", side_effect=capture), \
+            patch.object(engine_module, "_log_debug"), \
+            patch.object(engine_module.time, "sleep"):
+        worker.run()
+    return states
+
+
 class TestStateTransitions:
-    """Test state machine transitions per spec."""
-
-    def test_idle_to_countdown_on_start(self) -> None:
-        """EV_START should transition Idle -> Countdown."""
-        state = State.Idle
-        # Simulate EV_START
-        new_state = State.Countdown
-        assert new_state == State.Countdown
-
-    def test_countdown_to_sending(self) -> None:
-        """EV_COUNTDOWN_DONE should transition Countdown -> Sending."""
-        state = State.Countdown
-        new_state = State.Sending
-        assert new_state == State.Sending
-
-    def test_sending_to_cooling(self) -> None:
-        """EV_SENT_STEP_DONE should transition Sending -> Cooling."""
-        state = State.Sending
-        new_state = State.Cooling
-        assert new_state == State.Cooling
-
-    def test_cooling_to_waitinghold(self) -> None:
-        """EV_COOL_DONE should transition Cooling -> WaitingHold."""
-        state = State.Cooling
-        new_state = State.WaitingHold
-        assert new_state == State.WaitingHold
-
-    def test_waitinghold_to_sending_on_hold_pass_with_more_messages(self) -> None:
-        """EV_HOLD_PASS with more messages should go to Sending."""
-        state = State.WaitingHold
-        has_more_messages = True
-        new_state = State.Sending if has_more_messages else State.Idle
-        assert new_state == State.Sending
-
-    def test_waitinghold_to_idle_on_hold_pass_with_no_more_messages(self) -> None:
-        """EV_HOLD_PASS with no more messages should go to Idle."""
-        state = State.WaitingHold
-        has_more_messages = False
-        new_state = State.Sending if has_more_messages else State.Idle
-        assert new_state == State.Idle
-
-    def test_any_running_to_paused_on_pause(self) -> None:
-        """EV_PAUSE should transition any running state to Paused."""
-        running_states = [State.Sending, State.Cooling, State.WaitingHold]
-        for state in running_states:
-            new_state = State.Paused
-            assert new_state == State.Paused
+    """Test state machine transitions per spec, through AutomationWorker."""
+
+    def test_full_run_transitions(self, engine_module: ModuleType) -> None:
+        """A two-message run should follow Spec 9.2 from start to Idle.
+
+        Idle -> Countdown (EV_START) -> Sending (EV_COUNTDOWN_DONE)
+        -> Cooling (EV_SENT_STEP_DONE) -> WaitingHold (EV_COOL_DONE)
+        -> Sending (EV_HOLD_PASS, more messages) -> ... -> Idle
+        (EV_HOLD_PASS, no more messages).
+        """
+        states = _run_worker(engine_module, ["msg1", "msg2"])
+
+        assert states == [
+            State.Countdown,
+            State.Sending,
+            State.Cooling,
+            State.WaitingHold,
+            State.Sending,
+            State.Cooling,
+            State.WaitingHold,
+            State.Idle,
+        ]
+
+    @pytest.mark.parametrize(
+        "pause_at",
+        [State.Sending, State.Cooling, State.WaitingHold],
+        ids=lambda s: s.name,
+    )
+    def test_pause_and_resume_from_running_state(
+        self, engine_module: ModuleType, pause_at: State
+    ) -> None:
+        """EV_PAUSE should go to Paused and EV_RESUME back to the same state."""
+        requested: list[State] = []
+
+        def on_state(worker: "AutomationWorker", state: State) -> None:
+            if state == pause_at and not requested:
+                requested.append(state)
+                worker.request_pause()
+            elif state == State.Paused:
+                worker.request_resume()
+
+        states = _run_worker(engine_module, ["msg1"], on_state)
+
+        paused = states.index(State.Paused)
+        assert states[paused - 1] == pause_at
+        assert states[paused + 1] == pause_at
+        assert states[-1] == State.Idle
+
+    def test_stop_while_paused_returns_to_idle(self, engine_module: ModuleType) -> None:
+        """EV_STOP during pause should end the run in Idle."""
+
+        def on_state(worker: "AutomationWorker", state: State) -> None:
+            if state == State.Cooling:
+                worker.request_pause()
+            elif state == State.Paused:
+                worker.request_stop()
+
+        states = _run_worker(engine_module, ["msg1", "msg2"], on_state)
+
+        assert states == [
+            State.Countdown,
+            State.Sending,
+            State.Cooling,
+            State.Paused,
+            State.Idle,
+        ]
 
 
 class TestCtrl001PauseFreezes:
     """Test CTRL-001: Pause冻结frame_t0与计数器"""
 
-    def test_pause_preserves_frame_t0(self) -> None:
+    def test_pause_preserves_frame_t0(
+        self, calc: DiffCalculator, ref_frame_100: np.ndarray
+    ) -> None:
         """Pause should preserve frame_t0 per CTRL-001."""
-        roi = ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=50, h=50))
-        calc = DiffCalculator(roi, threshold=0.02)
-
         # Set up reference frame
-        reference = np.full((50, 50), 100, dtype=np.uint8)
-        calc.set_reference(reference)
+        calc.set_reference(ref_frame_100)
 
         # Freeze (simulate pause)
         frozen = calc.freeze_state()
 
         # Verify frame_t0 is captured
-        np.testing.assert_array_equal(frozen["frame_t0"], reference)
+        assert np.array_equal(frozen.frame_t0, ref_frame_100)
 
-    def test_pause_preserves_hold_hits_at_zero(self) -> None:
+    def test_pause_preserves_hold_hits_at_zero(
+        self, calc: DiffCalculator, ref_frame_zero: np.ndarray
+    ) -> None:
         """Pause with hold_hits=0 should preserve 0."""
-        roi = ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=50, h=50))
-        calc = DiffCalculator(roi, threshold=0.02)
-        calc.set_reference(np.zeros((50, 50), dtype=np.uint8))
+        calc.set_reference(ref_frame_zero)
 
         # No hits yet
         assert calc.hold_hits == 0
 
         frozen = calc.freeze_state()
-        assert frozen["hold_hits"] == 0
+        assert frozen.hold_hits == 0
 
-    def test_pause_preserves_hold_hits_at_one(self) -> None:
+    def test_pause_preserves_hold_hits_at_one(
+        self, calc: DiffCalculator, ref_frame_zero: np.ndarray
+    ) -> None:
         """Pause with hold_hits=1 should preserve 1."""
-        roi = ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=50, h=50))
-        calc = DiffCalculator(roi, threshold=0.02)
-        calc.set_reference(np.zeros((50, 50), dtype=np.uint8))
+        calc.set_reference(ref_frame_zero)
 
         # Simulate one hit
         calc._tracker._hold_hits = 1
 
         frozen = calc.freeze_state()
-        assert frozen["hold_hits"] == 1
+        assert frozen.hold_hits == 1
 
 
 class TestCtrl003MessageChangeOnResume:
@@ -442,22 +546,7 @@ class TestCtrl003MessageChangeOnResume:
 
     def test_resume_triggers_stop_on_change(self) -> None:
         """Resume with changes should trigger stop and return to Idle."""
-
-        class MockStateMachine:
-            def __init__(self) -> None:
-                self.state = State.Paused
-                self.messages_snapshot = ["msg1", "msg2", "msg3"]
-                self.dialog_shown = False
-
-            def resume(self, current_messages: list[str]) -> bool:
-                """Returns True if resumed successfully, False if stopped."""
-                if current_messages != self.messages_snapshot:
-                    self.state = State.Idle
-                    self.dialog_shown = True
-                    return False
-                return True
-
-        sm = MockStateMachine()
+        sm = _MockResumeStateMachine(["msg1", "msg2", "msg3"])
         current = ["msg1", "msg2"]  # Modified during pause
 
         success = sm.resume(current)
@@ -470,14 +559,12 @@ class TestCtrl003MessageChangeOnResume:
 class TestCtrl004NoChangeResume:
     """Test CTRL-004: Pause期间未变化正常Resume"""
 
-    def test_resume_continues_with_same_frame_t0(self) -> None:
+    def test_resume_continues_with_same_frame_t0(
+        self, calc: DiffCalculator, ref_frame_128: np.ndarray
+    ) -> None:
         """Resume without changes should use same frame_t0."""
-        roi = ROI(shape=ROIShape.RECT, rect=Rect(x=0, y=0, w=50, h=50))
-        calc = DiffCalculator(roi, threshold=0.02)
-
         # Set up state before pause
-        original_frame = np.full((50, 50), 123, dtype=np.uint8)
-        calc.set_reference(original_frame)
+        calc.set_reference(ref_frame_128)
         calc._tracker._hold_hits = 1
 
         # Freeze
@@ -490,7 +577,7 @@ class TestCtrl004NoChangeResume:
         calc.restore_state(frozen)
 
         # Verify frame_t0 is restored
-        np.testing.assert_array_equal(calc.frame_t0, original_frame)
+        assert np.array_equal(calc.frame_t0, ref_frame_128)
         assert calc.hold_hits == 1
 
 